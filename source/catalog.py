@@ -0,0 +1,503 @@
+"""!
+@file catalog.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the compiled representation of the dataflow models classification used to score the whole catalog at once.
+"""
+
+import json
+import hashlib
+import itertools
+from collections import OrderedDict
+
+import numpy as np
+
+## Label of the item scoring the rate range of a dataflow model.
+DOMAIN_RATE = 'Domain rate'
+## Label of the item scoring the rate and topology updates of a dataflow model.
+RATE_TOPOLOGY_DYNAMISM = 'Rate and topology dynamism'
+
+## Turing class of non Turing complete models.
+NON_TURING_COMPLETE = 0
+## Turing class of Turing complete models.
+TURING_COMPLETE = 1
+## Turing class of meta-models, for which the Turing completeness is not defined.
+META_MODEL = 2
+## Turing class of models with an invalid Turing completeness.
+UNKNOWN_TURING_CLASS = 3
+
+## Number of weight vectors whose scores are cached by CompiledCatalog.score().
+CACHE_SIZE = 16
+## Maximum number of (entry, weight vector) products held at once by CompiledCatalog.product(), which bounds its memory when several weight vectors are multiplied.
+PRODUCT_SIZE = 1 << 22
+
+## Score of each rate range.
+RATE_RANGE_LEVELS = {'{1}': 0, 'N*': 1, 'N': 2, 'Q*': 3, 'Omega': 4}
+## Score of each rate or topology update policy.
+UPDATE_LEVELS = {'never': 0, 'biso': 2, 'biro': 4, 'wiso': 6, 'wiro': 8}
+
+
+def rateRangeScore(range_rate):
+    """!
+    @brief Get the score of the rate range.
+    @param range_rate The rate range to check.
+    @return The score of the rate range, between 0 and 1.
+    """
+    return RATE_RANGE_LEVELS.get(range_rate, 0) / 4
+
+
+def updatesScore(updates):
+    """!
+    @brief Get the score of a set of rate or topology update policies.
+    @param updates The update policies (one or two distinct values).
+    @return The score of the update policies, between 0 and 8.
+    """
+    if len(updates) == 1:
+        return UPDATE_LEVELS.get(updates[0], 0)
+    if len(updates) == 2 and updates[0] != updates[1] and updates[0] in UPDATE_LEVELS and updates[1] in UPDATE_LEVELS:
+        return (UPDATE_LEVELS[updates[0]] + UPDATE_LEVELS[updates[1]]) // 2
+    return 0
+
+
+def rateTopologyUpdatesScore(rate_updates, topology_updates):
+    """!
+    @brief Get the score of the rate and topology updates.
+    @param rate_updates The rate updates to check.
+    @param topology_updates The topology updates to check.
+    @return The score of the rate and topology updates, between 0 and 2.
+    """
+    return (updatesScore(rate_updates) + updatesScore(topology_updates)) / 8
+
+
+def turingClass(turing_complete):
+    """!
+    @brief Get the Turing class of a dataflow model.
+    @param turing_complete The `turing_complete` value of the dataflow model.
+    @return The Turing class of the model.
+    """
+    if turing_complete is None:
+        return META_MODEL
+    if turing_complete == True:
+        return TURING_COMPLETE
+    if turing_complete == False:
+        return NON_TURING_COMPLETE
+    return UNKNOWN_TURING_CLASS
+
+
+def objectiveScore(expressiveness, analyzability, objective):
+    """!
+    @brief Get the score ranking the dataflow models.
+    @param expressiveness The expressiveness scores.
+    @param analyzability The analyzability scores.
+    @param objective The score ranking the models: 'expressiveness', 'analyzability' or 'total' (sum of both).
+    @return The scores ranking the models.
+    @throw ValueError If the objective is unknown.
+    """
+    if objective == 'expressiveness':
+        return expressiveness
+    if objective == 'analyzability':
+        return analyzability
+    if objective == 'total':
+        return expressiveness + analyzability
+    raise ValueError('Unknown objective: ' + str(objective))
+
+
+def checkModel(model):
+    """!
+    @brief Check that the description of a dataflow model has the structure expected in `classification.json`.
+    @param model The description of the dataflow model.
+    @throw ValueError If the description is not valid.
+    """
+    if not isinstance(model, dict):
+        raise ValueError('A dataflow model must be a JSON object.')
+    for key in ('name', 'range_rate', 'turing_complete'):
+        if key not in model:
+            raise ValueError('A dataflow model must have a ' + key + '.')
+    for key in ('name', 'range_rate'):
+        if not isinstance(model[key], str):
+            raise ValueError('The ' + key + ' of a dataflow model must be a string.')
+    for key in ('rate_updates', 'topology_updates', 'features', 'analyzability'):
+        if not isinstance(model.get(key), list):
+            raise ValueError('The ' + key + ' of a dataflow model must be a list.')
+        if not all(isinstance(value, str) for value in model[key]):
+            raise ValueError('The ' + key + ' of a dataflow model must be a list of strings.')
+
+
+class CompiledCatalog:
+    """!
+    @brief This class compiles the dataflow models classification into a sparse matrix so that any weighting of the hierarchy items is scored over the whole catalog with a single matrix-vector product.
+
+    Items (i.e. the columns of the matrix) are the features of `features.json`, then the domain rate and the rate and topology dynamism, then the static analyses of `analyzability.json`. Each dataflow model owns two rows: an expressiveness row (features and dynamism items) followed by an analyzability row (static analyses). The matrix is stored in CSR format (`indptr`, `indices`, `data`).
+    The features and static analyses of each model are also kept as boolean incidence matrices, which index the catalog for filtering.
+    """
+
+    def __init__(self, features, analyzability, dataflow_models):
+        """!
+        @brief Compile the classification.
+        @param features The features (abbreviation to name).
+        @param analyzability The static analyses (abbreviation to name).
+        @param dataflow_models The dataflow models (key to description).
+        """
+        self.features = features
+        self.analyzability = analyzability
+        self.labels = list(features.values()) + [DOMAIN_RATE, RATE_TOPOLOGY_DYNAMISM] + list(analyzability.values())
+        self.feature_columns = {k: i for i, k in enumerate(features)}
+        self.domain_rate_column = len(features)
+        self.dynamism_column = len(features) + 1
+        self.analyzability_columns = {k: len(features) + 2 + i for i, k in enumerate(analyzability)}
+        self.keys = list(dataflow_models)
+        self.index = {k: i for i, k in enumerate(self.keys)}
+        self.names = []
+        self.feature_incidence = np.zeros((0, len(features)), dtype=bool)
+        self.analyzability_incidence = np.zeros((0, len(analyzability)), dtype=bool)
+        self.range_rate_scores = np.zeros(0)
+        self.dynamism_scores = np.zeros(0)
+        self.turing_classes = np.zeros(0, dtype=np.int8)
+        self.resize(len(self.keys))
+        for i, key in enumerate(self.keys):
+            self.setModel(i, dataflow_models[key])
+        self.cache = OrderedDict()
+        self.buildMatrix()
+
+    def resize(self, size):
+        """!
+        @brief Resize the incidence matrices and score arrays, keeping the compiled models which fit in the new size.
+        @param size The new number of rows.
+        """
+        def resized(array):
+            result = np.zeros((size,) + array.shape[1:], dtype=array.dtype)
+            result[:min(size, len(array))] = array[:size]
+            return result
+        self.names = self.names[:size] + [''] * (size - len(self.names))
+        self.feature_incidence = resized(self.feature_incidence)
+        self.analyzability_incidence = resized(self.analyzability_incidence)
+        self.range_rate_scores = resized(self.range_rate_scores)
+        self.dynamism_scores = resized(self.dynamism_scores)
+        self.turing_classes = resized(self.turing_classes)
+
+    def setModel(self, position, model):
+        """!
+        @brief Compile a dataflow model in the incidence matrices and score arrays.
+        @param position The position of the model in the catalog.
+        @param model The description of the dataflow model.
+        """
+        model_features = set(model['features'])
+        model_analyzability = set(model['analyzability'])
+        self.names[position] = model['name']
+        self.feature_incidence[position] = [k in model_features for k in self.feature_columns]
+        self.analyzability_incidence[position] = [k in model_analyzability for k in self.analyzability_columns]
+        self.range_rate_scores[position] = rateRangeScore(model['range_rate'])
+        self.dynamism_scores[position] = rateTopologyUpdatesScore(model['rate_updates'], model['topology_updates'])
+        self.turing_classes[position] = turingClass(model['turing_complete'])
+
+    def buildMatrix(self):
+        """!
+        @brief Build the CSR matrix from the incidence matrices and score arrays.
+        """
+        self.digest = None
+        self.packed_incidence = None
+        models = len(self.keys)
+        features = len(self.features)
+        stored = np.zeros((models, 2, len(self.labels)), dtype=bool)
+        stored[:, 0, :features] = self.feature_incidence
+        stored[:, 0, self.domain_rate_column] = self.range_rate_scores != 0
+        stored[:, 0, self.dynamism_column] = self.dynamism_scores != 0
+        stored[:, 1, features + 2:] = self.analyzability_incidence
+        stored = stored.reshape(2 * models, len(self.labels))
+        rows, self.indices = np.nonzero(stored)
+        self.data = np.ones(len(rows))
+        for column, scores in ((self.domain_rate_column, self.range_rate_scores), (self.dynamism_column, self.dynamism_scores)):
+            entries = self.indices == column
+            self.data[entries] = scores[rows[entries] // 2]
+        self.indptr = np.zeros(2 * models + 1, dtype=np.int64)
+        np.cumsum(np.count_nonzero(stored, axis=1), out=self.indptr[1:])
+
+    def patch(self, models):
+        """!
+        @brief Apply the changes of some dataflow models to the compiled catalog, without compiling the unchanged models again.
+
+        Changed models keep their position, new models are appended and removed models are dropped. The changed and new models are compiled on their own first, so that an invalid model leaves the catalog unchanged, then their rows are spliced into the CSR matrix between the unchanged slices of the previous one. The cached scores are patched for the changed and new models only.
+        @param models The changed dataflow models (key to description, or to None for a removed model).
+        @return The keys of the changed and new models.
+        """
+        removed = [k for k, m in models.items() if m is None and k in self.index]
+        changed = [k for k, m in models.items() if m is not None and k in self.index]
+        added = [k for k, m in models.items() if m is not None and k not in self.index]
+        compiled = CompiledCatalog(self.features, self.analyzability, {k: models[k] for k in changed + added})
+        # Rows of the previous matrix replaced (changed models) or dropped (removed models), by position.
+        replaced = sorted([(self.index[k], compiled.index[k]) for k in changed] + [(self.index[k], None) for k in removed])
+        lengths = np.diff(self.indptr)
+        compiled_lengths = np.diff(compiled.indptr)
+        pieces = []
+        previous = 0
+        for position, source in replaced + [(len(self.keys), None)]:
+            pieces.append((self, 2 * previous, 2 * position))
+            if source is not None:
+                pieces.append((compiled, 2 * source, 2 * source + 2))
+            previous = position + 1
+        pieces.append((compiled, 2 * len(changed), 2 * len(compiled.keys)))
+        self.indices = np.concatenate([c.indices[c.indptr[begin]:c.indptr[end]] for c, begin, end in pieces])
+        self.data = np.concatenate([c.data[c.indptr[begin]:c.indptr[end]] for c, begin, end in pieces])
+        self.indptr = np.zeros(1 + sum(end - begin for _, begin, end in pieces), dtype=np.int64)
+        np.cumsum(np.concatenate([(lengths if c is self else compiled_lengths)[begin:end] for c, begin, end in pieces]), out=self.indptr[1:])
+        for key in changed:
+            self.copyModel(self.index[key], compiled, compiled.index[key])
+        kept = None
+        if removed:
+            kept = np.ones(len(self.keys), dtype=bool)
+            kept[self.indicesOf(removed)] = False
+            self.keys = list(itertools.compress(self.keys, kept.tolist()))
+            self.index = dict(zip(self.keys, range(len(self.keys))))
+            self.names = list(itertools.compress(self.names, kept.tolist()))
+            self.feature_incidence = self.feature_incidence[kept]
+            self.analyzability_incidence = self.analyzability_incidence[kept]
+            self.range_rate_scores = self.range_rate_scores[kept]
+            self.dynamism_scores = self.dynamism_scores[kept]
+            self.turing_classes = self.turing_classes[kept]
+        if added:
+            self.index.update({k: len(self.keys) + i for i, k in enumerate(added)})
+            self.keys = self.keys + added
+            self.resize(len(self.keys))
+            for key in added:
+                self.copyModel(self.index[key], compiled, compiled.index[key])
+        self.digest = None
+        self.packed_incidence = None
+        updated = self.indicesOf(changed + added)
+        for (weights, offset), (expressiveness, analyzability) in self.cache.items():
+            if kept is not None:
+                expressiveness = expressiveness[kept]
+                analyzability = analyzability[kept]
+            expressiveness = np.concatenate([expressiveness, np.zeros(len(added))])
+            analyzability = np.concatenate([analyzability, np.zeros(len(added))])
+            result = self.product(np.frombuffer(weights), np.stack([2 * updated, 2 * updated + 1], axis=1).ravel())
+            expressiveness[updated] = result[0::2] + offset
+            analyzability[updated] = result[1::2]
+            self.cache[(weights, offset)] = (expressiveness, analyzability)
+        return changed + added
+
+    def copyModel(self, position, catalog, source):
+        """!
+        @brief Copy a compiled dataflow model of another catalog with the same vocabulary in the incidence matrices and score arrays.
+        @param position The position of the model in this catalog.
+        @param catalog The other catalog.
+        @param source The position of the model in the other catalog.
+        """
+        self.names[position] = catalog.names[source]
+        self.feature_incidence[position] = catalog.feature_incidence[source]
+        self.analyzability_incidence[position] = catalog.analyzability_incidence[source]
+        self.range_rate_scores[position] = catalog.range_rate_scores[source]
+        self.dynamism_scores[position] = catalog.dynamism_scores[source]
+        self.turing_classes[position] = catalog.turing_classes[source]
+
+    def save(self, path):
+        """!
+        @brief Save the compiled catalog in a numpy archive.
+        @param path The path of the archive.
+        """
+        np.savez_compressed(path,
+            vocabulary=np.array(json.dumps({'features': self.features, 'analyzability': self.analyzability})),
+            keys=np.array(self.keys, dtype=str), names=np.array(self.names, dtype=str),
+            feature_incidence=self.feature_incidence, analyzability_incidence=self.analyzability_incidence,
+            range_rate_scores=self.range_rate_scores, dynamism_scores=self.dynamism_scores, turing_classes=self.turing_classes)
+
+    @classmethod
+    def load(cls, path):
+        """!
+        @brief Load a compiled catalog saved by save().
+        @param path The path of the archive.
+        @return The compiled catalog.
+        """
+        with np.load(path) as archive:
+            vocabulary = json.loads(str(archive['vocabulary']))
+            catalog = cls(vocabulary['features'], vocabulary['analyzability'], {})
+            catalog.keys = archive['keys'].tolist()
+            catalog.index = {k: i for i, k in enumerate(catalog.keys)}
+            catalog.names = archive['names'].tolist()
+            catalog.feature_incidence = archive['feature_incidence']
+            catalog.analyzability_incidence = archive['analyzability_incidence']
+            catalog.range_rate_scores = archive['range_rate_scores']
+            catalog.dynamism_scores = archive['dynamism_scores']
+            catalog.turing_classes = archive['turing_classes']
+        catalog.buildMatrix()
+        return catalog
+
+    def __len__(self):
+        return len(self.keys)
+
+    def fingerprint(self):
+        """!
+        @brief Get a hash of the compiled catalog, which changes whenever the vocabulary or a compiled model changes.
+        @return The hexadecimal SHA-256 digest.
+        """
+        if self.digest is None:
+            digest = hashlib.sha256()
+            digest.update(json.dumps({'features': self.features, 'analyzability': self.analyzability}).encode())
+            digest.update('\0'.join(self.keys).encode())
+            digest.update('\0'.join(self.names).encode())
+            for array in (self.feature_incidence, self.analyzability_incidence, self.range_rate_scores, self.dynamism_scores, self.turing_classes):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            self.digest = digest.hexdigest()
+        return self.digest
+
+    def indicesOf(self, models):
+        """!
+        @brief Get the position of dataflow models in the catalog.
+        @param models The keys of the dataflow models.
+        @return An array of positions.
+        """
+        return np.fromiter((self.index[m] for m in models), dtype=np.int64, count=len(models))
+
+    def product(self, weights, rows=None):
+        """!
+        @brief Multiply the compiled matrix, or some of its rows, by one or several weight vectors.
+        @param weights An array of shape (items,) or (items, k).
+        @param rows The rows to multiply, all rows by default.
+        @return An array of shape (rows,) or (rows, k).
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        columns = weights.shape[1] if weights.ndim > 1 else 1
+        count = len(self.indptr) - 1 if rows is None else len(rows)
+        # A row has at most one entry per item, the rows are multiplied chunk by chunk so that at most PRODUCT_SIZE products are held at once.
+        chunk_size = max(1, PRODUCT_SIZE // (columns * max(1, len(self.labels))))
+        if count > chunk_size:
+            rows = np.arange(count) if rows is None else np.asarray(rows)
+            result = np.empty((count,) + weights.shape[1:])
+            for start in range(0, count, chunk_size):
+                result[start:start + chunk_size] = self.product(weights, rows[start:start + chunk_size])
+            return result
+        starts = self.indptr[:-1]
+        ends = self.indptr[1:]
+        if rows is None:
+            indices = self.indices
+            data = self.data
+        else:
+            starts = starts[rows]
+            ends = ends[rows]
+            lengths = ends - starts
+            # Positions of the entries of the selected rows, row after row.
+            entries = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            indices = self.indices[entries]
+            data = self.data[entries]
+            ends = np.cumsum(lengths)
+            starts = ends - lengths
+        contributions = data.reshape((-1,) + (1,) * (weights.ndim - 1)) * weights[indices]
+        result = np.zeros((len(starts),) + weights.shape[1:])
+        non_empty = starts < ends
+        if np.any(non_empty):
+            result[non_empty] = np.add.reduceat(contributions, starts[non_empty], axis=0)
+        return result
+
+    def score(self, weights, offset=0.0):
+        """!
+        @brief Score all dataflow models of the catalog.
+
+        The scores of the last weight vectors are cached, so that going back to a previous weighting does not score the catalog again.
+        @param weights The weight of each item, an array of shape (items,) or (items, k) to score k hierarchies at once.
+        @param offset The constant added to the expressiveness score, a scalar or an array of shape (k,).
+        @return The expressiveness and analyzability scores, two arrays of shape (models,) or (models, k).
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim > 1:
+            result = self.product(weights)
+            return result[0::2] + offset, result[1::2]
+        key = self.scoreKey(weights, offset)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        else:
+            result = self.product(weights)
+            self.cache[key] = (result[0::2] + offset, result[1::2])
+            if len(self.cache) > CACHE_SIZE:
+                self.cache.popitem(last=False)
+        return self.cache[key]
+
+    @staticmethod
+    def scoreKey(weights, offset=0.0):
+        """!
+        @brief Get the key identifying the scores of a weight vector in the cache of score().
+        @param weights The weight of each item, an array of shape (items,).
+        @param offset The constant added to the expressiveness score.
+        @return The key, a hashable value.
+        """
+        return (np.asarray(weights, dtype=np.float64).tobytes(), float(offset))
+
+    def cacheScores(self, weights, offset, expressiveness, analyzability):
+        """!
+        @brief Add scores computed elsewhere for this catalog (e.g. saved in a session) to the cache of score().
+        @param weights The weight of each item, an array of shape (items,).
+        @param offset The constant added to the expressiveness score.
+        @param expressiveness The expressiveness scores of all the models.
+        @param analyzability The analyzability scores of all the models.
+        """
+        self.cache[self.scoreKey(weights, offset)] = (expressiveness, analyzability)
+        if len(self.cache) > CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+    def bitsets(self):
+        """!
+        @brief Get the features and static analyses of each model as a bitset.
+        @return An array of shape (models, words) of 64-bit words.
+        """
+        if self.packed_incidence is None:
+            packed = np.packbits(np.concatenate([self.feature_incidence, self.analyzability_incidence], axis=1), axis=1)
+            padded = np.zeros((len(packed), max(1, -(-packed.shape[1] // 8)) * 8), dtype=np.uint8)
+            padded[:, :packed.shape[1]] = packed
+            self.packed_incidence = padded.view(np.uint64)
+        return self.packed_incidence
+
+    def jaccardDistances(self, position, candidates):
+        """!
+        @brief Get the Jaccard distance between the features and static analyses of a model and of other models, with popcounts of their bitsets.
+        @param position The position of the model.
+        @param candidates The positions of the other models.
+        @return The distances, between 0 (same features and static analyses) and 1 (none in common). Two models without any feature or static analysis are at distance 0.
+        """
+        bitsets = self.bitsets()
+        rows = bitsets[candidates]
+        intersection = np.bitwise_count(rows & bitsets[position]).sum(axis=1, dtype=np.int64)
+        union = np.bitwise_count(rows | bitsets[position]).sum(axis=1, dtype=np.int64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(union > 0, 1 - intersection / union, 0.0)
+
+    def filterMask(self, features, all_features, analyzability, all_analyzability, turing_classes):
+        """!
+        @brief Get the dataflow models matching the filters.
+        @param features The abbreviations of the selected features (None for a selected feature which is not in `features.json`, matched by no model).
+        @param all_features True if models must have all the selected features, False if they must have at least one of them.
+        @param analyzability The abbreviations of the selected static analyses (None for a selected static analysis which is not in `analyzability.json`).
+        @param all_analyzability True if models must have all the selected static analyses, False if they must have at least one of them.
+        @param turing_classes The displayed Turing classes (NON_TURING_COMPLETE, TURING_COMPLETE, META_MODEL).
+        @return A boolean array over the models of the catalog.
+        """
+        mask = np.isin(self.turing_classes, list(turing_classes))
+        mask &= self.incidenceMask(self.feature_incidence, self.feature_columns, features, all_features)
+        mask &= self.incidenceMask(self.analyzability_incidence, {k: c - len(self.features) - 2 for k, c in self.analyzability_columns.items()}, analyzability, all_analyzability)
+        return mask
+
+    def filterMaskFromJSON(self, filters):
+        """!
+        @brief Get the dataflow models matching filters given in JSON.
+        @param filters The filters: `{"features": [abbreviations], "all_features": Boolean, "analyzability": [abbreviations], "all_analyzability": Boolean, "turing_complete": [true, false, null]}`, all fields are optional and no filter keeps all models.
+        @return A boolean array over the models of the catalog.
+        @throw ValueError If the filters are not valid.
+        """
+        if not isinstance(filters, dict):
+            raise ValueError('The filters must be a JSON object.')
+        turing_classes = [turingClass(t) for t in filters.get('turing_complete', [False, True, None])]
+        return self.filterMask(filters.get('features', []), filters.get('all_features', True), filters.get('analyzability', []), filters.get('all_analyzability', True), turing_classes)
+
+    def incidenceMask(self, incidence, columns, selected, all_selected):
+        """!
+        @brief Get the dataflow models having all or any of the selected items of an incidence matrix.
+        @param incidence The incidence matrix.
+        @param columns The column of each item (abbreviation to column).
+        @param selected The abbreviations of the selected items.
+        @param all_selected True if models must have all the selected items, False if they must have at least one of them.
+        @return A boolean array over the models of the catalog.
+        """
+        known = [columns[k] for k in selected if k in columns]
+        if all_selected:
+            if len(known) < len(selected):
+                return np.zeros(len(self.keys), dtype=bool)
+            return incidence[:, known].all(axis=1)
+        return incidence[:, known].any(axis=1)
@@ -0,0 +1,148 @@
+"""!
+@file catalogdiff.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the tool reporting how the scores and ranks of the dataflow models move between two versions of the classification.
+
+Usage:
+```bash
+python3 source/catalogdiff.py old-classification.json new-classification.json resources/hierarchy-example.json [other hierarchies...] -o diff.csv
+```
+"""
+
+import sys
+import csv
+import json
+import argparse
+
+import numpy as np
+
+from comparison import scoreHierarchies, rankDescending
+from hierarchy import Hierarchy
+from ingestion import loadCatalog
+
+## Number of rows written at once in the report.
+ROWS_CHUNK_SIZE = 65536
+
+
+def formatValue(value):
+    """!
+    @brief Format a score or a rank for the report.
+    @param value The score or rank.
+    @return The formatted value.
+    """
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+class CatalogDiff:
+    """!
+    @brief This class compares the scores and ranks of the dataflow models of two versions of the classification under several hierarchies.
+
+    Both versions are scored with all hierarchies in batched products, then joined on the model keys through the index of the new catalog. The memory used grows with the size of the catalogs: both compiled catalogs and the scores and ranks of all their models under all hierarchies are held at once. Only the products, the deltas and the written report are processed chunk by chunk.
+    """
+
+    def __init__(self, old_catalog, new_catalog, hierarchies, objective='total'):
+        """!
+        @brief Compare two versions of the classification.
+        @param old_catalog The compiled catalog of the old version.
+        @param new_catalog The compiled catalog of the new version.
+        @param hierarchies The hierarchies.
+        @param objective The score ranking the models: 'expressiveness', 'analyzability' or 'total' (sum of both).
+        """
+        self.old_scores = scoreHierarchies(old_catalog, hierarchies, old_catalog.keys, objective)
+        self.new_scores = scoreHierarchies(new_catalog, hierarchies, new_catalog.keys, objective)
+        self.old_ranks = rankDescending(self.old_scores)
+        self.new_ranks = rankDescending(self.new_scores)
+        self.old_keys = old_catalog.keys
+        self.new_keys = new_catalog.keys
+        matches = np.fromiter((new_catalog.index.get(k, -1) for k in old_catalog.keys), dtype=np.int64, count=len(old_catalog))
+        self.old_positions = np.flatnonzero(matches >= 0)
+        self.new_positions = matches[self.old_positions]
+        self.removed_positions = np.flatnonzero(matches < 0)
+        added = np.ones(len(new_catalog), dtype=bool)
+        added[self.new_positions] = False
+        self.added_positions = np.flatnonzero(added)
+        self.changed = np.zeros(len(self.old_positions), dtype=bool)
+        for start in range(0, len(self.old_positions), ROWS_CHUNK_SIZE):
+            score_deltas, rank_deltas = self.deltas(np.arange(start, min(start + ROWS_CHUNK_SIZE, len(self.old_positions))))
+            self.changed[start:start + ROWS_CHUNK_SIZE] = np.any(score_deltas != 0, axis=1) | np.any(rank_deltas != 0, axis=1)
+
+    def deltas(self, rows):
+        """!
+        @brief Get the score and rank deltas of some of the models of both versions.
+        @param rows The rows of the models in the joined models.
+        @return The score deltas and the rank deltas, two arrays of shape (rows, hierarchies).
+        """
+        old = self.old_positions[rows]
+        new = self.new_positions[rows]
+        return self.new_scores[new] - self.old_scores[old], self.new_ranks[new] - self.old_ranks[old]
+
+    def summary(self):
+        """!
+        @brief Get a summary of the differences.
+        @return A string with the number of added, removed, moved and unchanged models.
+        """
+        moved = int(np.count_nonzero(self.changed))
+        return (str(len(self.added_positions)) + " added, " + str(len(self.removed_positions)) + " removed, "
+                + str(moved) + " with score or rank changes, " + str(len(self.old_positions) - moved) + " unchanged")
+
+    def writeCSV(self, f, names, all_models=False):
+        """!
+        @brief Write the report in CSV format, chunk by chunk.
+        @param f The file to write.
+        @param names The names of the hierarchies.
+        @param all_models True to also report the models whose scores and ranks did not move.
+        """
+        writer = csv.writer(f)
+        header = ['model', 'status']
+        for name in names:
+            header += [name + ' old score', name + ' new score', name + ' score delta', name + ' old rank', name + ' new rank', name + ' rank delta']
+        writer.writerow(header)
+        rows = np.arange(len(self.old_positions)) if all_models else np.flatnonzero(self.changed)
+        for start in range(0, len(rows), ROWS_CHUNK_SIZE):
+            chunk = rows[start:start + ROWS_CHUNK_SIZE]
+            old = self.old_positions[chunk]
+            new = self.new_positions[chunk]
+            score_deltas, rank_deltas = self.deltas(chunk)
+            values = np.stack([self.old_scores[old], self.new_scores[new], score_deltas, self.old_ranks[old], self.new_ranks[new], rank_deltas], axis=2)
+            for position, changed, row in zip(old.tolist(), self.changed[chunk], values.reshape(len(chunk), -1).tolist()):
+                writer.writerow([self.old_keys[position], 'changed' if changed else 'unchanged'] + [formatValue(v) for v in row])
+        for positions, keys, scores, ranks, status in ((self.removed_positions, self.old_keys, self.old_scores, self.old_ranks, 'removed'), (self.added_positions, self.new_keys, self.new_scores, self.new_ranks, 'added')):
+            for start in range(0, len(positions), ROWS_CHUNK_SIZE):
+                chunk = positions[start:start + ROWS_CHUNK_SIZE]
+                for position, model_scores, model_ranks in zip(chunk.tolist(), scores[chunk].tolist(), ranks[chunk].tolist()):
+                    row = [keys[position], status]
+                    for score, rank in zip(model_scores, model_ranks):
+                        if status == 'removed':
+                            row += [formatValue(score), '', '', formatValue(rank), '', '']
+                        else:
+                            row += ['', formatValue(score), '', '', formatValue(rank), '']
+                    writer.writerow(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Report the score and rank changes of the dataflow models between two versions of the classification')
+    parser.add_argument('old', type=str, help='Old version of the classification (JSON or JSON Lines)')
+    parser.add_argument('new', type=str, help='New version of the classification (JSON or JSON Lines)')
+    parser.add_argument('hierarchies', type=str, nargs='+', help='Hierarchy files')
+    parser.add_argument('--features', type=str, default='resources/features.json', help='Features file')
+    parser.add_argument('--analyzability', type=str, default='resources/analyzability.json', help='Static analyses file')
+    parser.add_argument('--objective', type=str, default='total', choices=['total', 'expressiveness', 'analyzability'], help='Score ranking the models')
+    parser.add_argument('--all', action='store_true', help='Also report the models whose scores and ranks did not move')
+    parser.add_argument('-o', '--output', type=str, default=None, help='CSV report (standard output by default)')
+    args = parser.parse_args()
+    with open(args.features) as f:
+        features = json.load(f)
+    with open(args.analyzability) as f:
+        analyzability = json.load(f)
+    old_catalog, _ = loadCatalog([args.old], features, analyzability)
+    new_catalog, _ = loadCatalog([args.new], features, analyzability)
+    hierarchies = [Hierarchy.load(h, old_catalog.labels) for h in args.hierarchies]
+    diff = CatalogDiff(old_catalog, new_catalog, hierarchies, args.objective)
+    if args.output:
+        with open(args.output, 'w', newline='') as f:
+            diff.writeCSV(f, args.hierarchies, args.all)
+    else:
+        diff.writeCSV(sys.stdout, args.hierarchies, args.all)
+    print(diff.summary(), file=sys.stderr)
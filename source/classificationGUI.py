@@ -45,6 +45,44 @@
 # 7. This area displays the description of the selected dataflow models in the table.
 # 8. Those buttons allow to import a hierarchy JSON file and to export the current displayed hierarchy to a JSON file.
 #
+# @subsection edit_menu Edit menu
+#
+# - **Undo** (Ctrl+Z) and **Redo** (Ctrl+Shift+Z): go back and forward through the changes of the hierarchy (moved items, coefficients and weights, loaded hierarchies) and of the filters. The scores of the most recent states are kept, so that going back or forward does not score the catalog again.
+#
+# @subsection tools_menu Tools menu
+#
+# - **Put selected model on top...**: searches the hierarchy with the fewest changes from the current one (moved items and changed coefficients) which gives the best rank to the model selected in the table among the displayed models, and proposes to apply it. Models are ranked by their expressiveness score, their analyzability score or the sum of both.
+# - **Compare hierarchies...**: loads several hierarchy files, scores the displayed models with all of them in a single batched product and shows the Kendall tau, Spearman or top-k overlap between every pair of resulting rankings as a heatmap.
+# - **Open linked view**: opens another window starting with the hierarchy and filters of the current one. Linked windows share the catalog and the computed scores, so a new window costs no loading nor scoring, and selecting a model in one window selects it in all the windows displaying it. Changes of the watched catalog files are displayed in all the windows.
+# - **Neighbourhood of selected model...**: lists, among the displayed models, the models which dominate the model selected in the table (no lower score and at least one higher score), the models it dominates, and its k nearest neighbours in the space of features and static analyses (Jaccard distance). The lists follow the selection of the table and a double click on a model selects it.
+# - **Export displayed results...**: exports the models displayed in the table, ranked by the sum of their expressiveness and analyzability scores, with their scores and attributes to a CSV, JSON Lines or Parquet file (Parquet requires the `pyarrow` package). The file is written chunk after chunk in the background and the export can be cancelled.
+# - **Open session...** and **Save session...**: a session file stores the filters, the hierarchy, the selected model and the displayed scores. When the catalog has not changed since the session was saved, opening it displays the stored scores without scoring the catalog again. A session can also be opened at startup with `python3 source/classificationGUI.py --session <path_to_session_file>`.
+# - **Watch catalog files**: when checked, changes of `resources/features.json`, `resources/analyzability.json` and `resources/classification.json` are displayed without restarting the GUI. A change of the classification only updates the changed models.
+#
+# @subsection cli_tools Command line tools
+#
+# - `source/catalogdiff.py` reports, for two versions of `resources/classification.json` and a set of hierarchy files, the score and rank deltas of every dataflow model as well as the added and removed models:
+# ```bash
+# python3 source/catalogdiff.py old-classification.json resources/classification.json resources/hierarchy-example.json -o diff.csv
+# ```
+# - `source/ingestion.py` compiles several classification files (JSON files with the structure of `resources/classification.json`, or JSON Lines files where each line is a model with an additional `key` field) into a single compiled catalog, reading them record after record. Records are checked against `resources/features.json` and `resources/analyzability.json`, and the last record of a key wins (`--conflicts first` keeps the first one):
+# ```bash
+# python3 source/ingestion.py resources/classification.json in-house-variants.jsonl -o catalog.npz
+# ```
+# - `source/service.py` is a local HTTP service (TCP port or Unix socket) scoring and filtering the dataflow models for other tools, without the GUI. Concurrent requests are scored together in a single batched product, and `GET /metrics` reports the latency and throughput of the service:
+# ```bash
+# python3 source/service.py --port 8080
+# curl -X POST localhost:8080/score -d '{"filters": {"features": ["pa"], "all_features": false}}'
+# ```
+# - `source/report.py` renders, without a display, the graph (PNG or SVG) and the table ranked by total score (CSV or HTML) of a list of hierarchy files, in a pool of worker processes. `--filters` takes a JSON file with the filters of the scoring service:
+# ```bash
+# python3 source/report.py resources/hierarchy-example.json other-hierarchy.json -o report --formats png svg csv html
+# ```
+# - `source/differential.py` checks that a scoring and filtering engine (by default the current implementation of the GUI) gives exactly the results of the original per-model implementation, on random catalogs, hierarchies and filters. A failing case is shrunk and printed as a minimal failing example:
+# ```bash
+# python3 source/differential.py --cases 1000 --seed 1
+# ```
+#
 # @section dev_guide Developer Guide
 #
 # This program is intended to be extended by systems designers, researchers, and engineers who want to add new features, static analyses, or dataflow models. Hereafter are some guidelines to help you get started.
@@ -87,6 +125,16 @@
 #   - `analyzability` is a set containing the static analyses of the dataflow model. The content of the set is the static analyses depends on dataflow model's rules,
 #   - `turing_complete` is a boolean value indicating whether the dataflow model is Turing complete or not. The possible values are: *true*, *false*, *null*. The value *null* is used for meta-models dataflow models, for which the Turing completeness is not defined.
 #
+# 4. **Writing a hierarchy file**: A hierarchy is a JSON file with the following structure:
+# ```json
+# {
+#     "category_1": {"coefficient": Number, "features": list of String},
+#     "category_2": {"coefficient": Number, "features": list of String},
+#     "weights": {String: Number}
+# }
+# ```
+#   where `features` lists the names of the features, static analyses, *Domain rate* and *Rate and topology dynamism* of each category, and the optional `weights` gives an individual weight to some of them, overriding the coefficient of their category. A file containing only `weights` is also valid. The GUI only loads coefficients that its spin boxes can display (integers between 0 and 3), other values can be given to the items through `weights`. The weight of an item can also be changed in the GUI by double-clicking it in the categories lists (cf. item 6). Whatever the weighting, the whole catalog is scored with a single sparse matrix-vector product (cf. `catalog.py`).
+#
 # @note While a new dataflow model added in the `resources/classification.json` file is immediately available in the GUI, the new features and static analyses added in the `resources/features.json` and `resources/analyzability.json` files are not. To make them available in the GUI, checkboxes must be added in the GUI. Unfortunately, I didn't find a way to do it automatically. So, you have to add them manually in the QT Designer. To do so, open the `main_window.ui` file in the QT Designer and add as much as checkboxes as you want. The text of the checkbox **must be the same** as the name of the feature or static analysis in the `resources/features.json` and `resources/analyzability.json` files, e.g., the text of the checkbox related to the feature `"bf": "Blocking factor"` in the `resources/features.json` file is `Blocking factor` (case sensitive).
 #
 # The following command line generates the main_window_ui.py file from the main_window.ui file:
@@ -100,38 +148,177 @@
 #
 # [2] G. Roumage, S. Azaiez, C. Faure and S. Louise, "An Extended Survey and a Comparison Framework for Dataflow Models of Computation and Communication", arXiv, 2025, https://arxiv.org/abs/2501.07273.
 
+import os
 import sys
 import json
+import time
 import argparse
+import itertools
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QFileSystemWatcher, QTimer, QThread, pyqtSignal
 from PyQt5.QtWidgets import (QApplication, QMainWindow)
-from PyQt5.QtWidgets import QCheckBox, QTableWidgetItem, QRadioButton, QDialog, QVBoxLayout, QLabel, QFileDialog
+from PyQt5.QtWidgets import QCheckBox, QTableWidgetItem, QRadioButton, QDialog, QVBoxLayout, QLabel, QFileDialog, QInputDialog, QMessageBox
+from PyQt5.QtWidgets import QHBoxLayout, QComboBox, QSpinBox, QProgressDialog, QMenu, QListWidget, QListWidgetItem
+from PyQt5.QtGui import QKeySequence
+import numpy as np
+import pyqtgraph as pg
 from main_window_ui import Ui_MainWindow
+from catalog import CompiledCatalog, checkModel, NON_TURING_COMPLETE, TURING_COMPLETE, META_MODEL
+from hierarchy import Hierarchy
+from optimizer import optimizeHierarchy
+from comparison import scoreHierarchies, kendallTauMatrix, spearmanMatrix, topKOverlapMatrix
+from export import ResultsExport, availableFormats, FORMATS
+from session import Session
+from history import History
+from neighbourhood import dominance, nearestNeighbours
+from catalogdiff import formatValue
+from workspace import Workspace
+from ingestion import iterJSONObject
+
+## Path of the features file.
+FEATURES_FILE = 'resources/features.json'
+## Path of the static analyses file.
+ANALYZABILITY_FILE = 'resources/analyzability.json'
+## Path of the dataflow models classification file.
+CLASSIFICATION_FILE = 'resources/classification.json'
+## Number of steps of the export progress dialog.
+EXPORT_PROGRESS_STEPS = 1000
+## Maximum number of models listed in each list of the neighbourhood dialog.
+NEIGHBOURHOOD_LIST_SIZE = 200
+
+class ExportThread(QThread):
+    """!
+    @brief This class writes an export of the results in the background.
+    """
+
+    ## Signal emitted after each written chunk with the number of written rows and the total number of rows.
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, export, path, format, parent=None):
+        """!
+        @brief Create the thread.
+        @param export The export of the results.
+        @param path The path of the exported file.
+        @param format The format of the exported file.
+        @param parent The parent object.
+        """
+        super().__init__(parent)
+        self.export = export
+        self.path = path
+        self.format = format
+        self.completed = False
+        self.error = None
+
+    def run(self):
+        try:
+            self.completed = self.export.write(self.path, self.format, self.reportProgress)
+        except (OSError, ImportError) as e:
+            self.error = str(e)
+
+    def reportProgress(self, written, total):
+        """!
+        @brief Report the progress of the export.
+        @param written The number of written rows.
+        @param total The total number of rows.
+        @return False if the export was cancelled, True otherwise.
+        """
+        self.progress.emit(written, total)
+        return not self.isInterruptionRequested()
+
+class ScoreItem(QTableWidgetItem):
+    """!
+    @brief This class describes a score cell of the table, sorted by the value of the score rather than by its text.
+    """
+
+    def __init__(self, score):
+        """!
+        @brief Create a score cell.
+        @param score The score.
+        """
+        text = str(int(score)) if float(score).is_integer() else str(score)
+        super().__init__(text)
+        self.setData(Qt.UserRole, float(score))
+
+    def __lt__(self, other):
+        return self.data(Qt.UserRole) < other.data(Qt.UserRole)
+
 
 class classificationGUI(QMainWindow, Ui_MainWindow):
     """!
     @brief This class implements the GUI for the dataflow models classification.
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, workspace=None, source=None, session=None):
+        """!
+        @brief Create a view.
+        @param parent The parent widget.
+        @param workspace The workspace shared with other views, None to load the catalog files in a new workspace.
+        @param source The view whose hierarchy and filters are displayed first by a view sharing its workspace.
+        @param session The path of a session file restored by a view with a new workspace instead of displaying the example hierarchy, None to display the example hierarchy.
+        """
         super().__init__(parent)
         self.setupUi(self)
+        self.workspace = workspace if workspace is not None else Workspace()
+        self.workspace.views.append(self)
+        self.workspace.selectionChanged.connect(self.showSelection)
+        self.workspace.catalogChanged.connect(self.refreshCatalog)
+        self.setupToolsMenu()
+        self.setupEditMenu()
         self.connectSignalsSlots()
         self.initialGuiConfiguration()
-        self.loadData()
-        self.loadHierarchy('resources/hierarchy-example.json')
-        self.updateTable()
-        
+        if workspace is None:
+            self.loadData()
+            # The example hierarchy is only scored if the session cannot be restored.
+            if session is None or not self.openSession(session):
+                self.loadHierarchy('resources/hierarchy-example.json')
+                self.updateTable()
+        else:
+            self.setFilterState(source.getFilterState())
+            self.applyHierarchy(source.currentHierarchy())
+            self.showSelection(self.workspace.selected_model)
+
+    @property
+    def features(self):
+        """The features (abbreviation to name), shared by the views of the workspace."""
+        return self.workspace.features
+
+    @features.setter
+    def features(self, features):
+        self.workspace.features = features
+
+    @property
+    def analyzability(self):
+        """The static analyses (abbreviation to name), shared by the views of the workspace."""
+        return self.workspace.analyzability
+
+    @analyzability.setter
+    def analyzability(self, analyzability):
+        self.workspace.analyzability = analyzability
+
+    @property
+    def dataflow_models(self):
+        """The dataflow models (key to description), shared by the views of the workspace."""
+        return self.workspace.dataflow_models
+
+    @dataflow_models.setter
+    def dataflow_models(self, dataflow_models):
+        self.workspace.dataflow_models = dataflow_models
+
+    @property
+    def catalog(self):
+        """The compiled catalog, with its index and score cache, shared by the views of the workspace."""
+        return self.workspace.catalog
+
+    @catalog.setter
+    def catalog(self, catalog):
+        self.workspace.catalog = catalog
+
     def initialGuiConfiguration(self):
         """!
         @brief Initialize the GUI configuration.
         """
         self.category_1_list.clear()
         self.category_2_list.clear()
-        self.features = {}
-        self.analyzability = {}
-        self.dataflow_models = {}
         for child in self.features_frame.findChildren(QCheckBox):
             child.setChecked(True)
         for child in self.analyzability_frame.findChildren(QCheckBox):
@@ -147,12 +334,17 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         self.graph.setBackground('w')
         self.graph.setLabel('left', 'Analyzability')
         self.graph.setLabel('bottom', 'Expressiveness')
+        ## Points of the displayed models and point of the selected model, updated in place.
+        self.points = self.graph.plot([], [], pen=None, symbol='+', symbolPen=None, symbolBrush='black')
+        self.highlighted_point = self.graph.plot([], [], pen=None, symbol='o', symbolPen=None, symbolBrush='red')
         self.rate_updates_content_label.setText('N/A')
         self.topology_updates_content_label.setText('N/A')
         self.domain_rate_content_label.setText('N/A')
         self.features_content_label.setText('N/A')
         self.analyzability_content_label.setText('N/A')
         self.table.setRowCount(0)
+        ## Name cell of the row of each displayed model.
+        self.table_items = {}
         self.table.setColumnCount(3)
         self.table.setHorizontalHeaderLabels(['Model', 'Expressiveness', 'Analyzability'])
         self.table.horizontalHeader().setStretchLastSection(True)
@@ -164,18 +356,19 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         """!
         @brief Load features, static analyses and the classification from JSON files.
         """
-        with open('resources/features.json') as f:
+        with open(FEATURES_FILE) as f:
             self.features = json.load(f)
         for value in self.features.values():
             self.category_1_list.addItem(value)
         self.category_1_list.addItem('Domain rate')
         self.category_1_list.addItem('Rate and topology dynamism')
-        with open('resources/analyzability.json') as f:
+        with open(ANALYZABILITY_FILE) as f:
             self.analyzability = json.load(f)
         for value in self.analyzability.values():
             self.category_1_list.addItem(value)
-        with open('resources/classification.json') as f:
+        with open(CLASSIFICATION_FILE) as f:
             self.dataflow_models = json.load(f)
+        self.catalog = CompiledCatalog(self.features, self.analyzability, self.dataflow_models)
     
     def selectNewHierarchyJSONFile(self):
         """!
@@ -190,30 +383,102 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         """!
         @brief Load the hierarchy from a JSON file.
         """
-        with open(hierarchy) as f:
-            hierarchy = json.load(f)
-            if 'category_1' in hierarchy and 'category_2' in hierarchy:
-                self.coefficient_category_1_spin_box.setValue(hierarchy['category_1']['coefficient'])
-                self.coefficient_category_2_spin_box.setValue(hierarchy['category_2']['coefficient'])
-                self.category_1_list.clear()
-                self.category_2_list.clear()
-                for value in hierarchy['category_1']['features']:
-                    self.category_1_list.addItem(value)
-                for value in hierarchy['category_2']['features']:
-                    self.category_2_list.addItem(value)
-            else:
-                self.error_dialog = QDialog(self)
-                self.error_dialog.setWindowTitle("Error")
-                self.error_dialog.setModal(True)
-                self.error_dialog.setFixedSize(300, 100)
-                layout = QVBoxLayout()
-                label = QLabel()
-                label.setWordWrap(True)
-                label.setText("The JSON file is not valid. Please check the format.")
-                label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                layout.addWidget(label)
-                self.error_dialog.setLayout(layout)
-                self.error_dialog.exec_()
+        try:
+            loaded = Hierarchy.load(hierarchy, self.catalog.labels)
+            self.checkCoefficients(loaded)
+        except ValueError as e:
+            self.showError("The JSON file is not valid. Please check the format.\n" + str(e))
+            return
+        self.applyHierarchy(loaded)
+
+    def showError(self, message):
+        """!
+        @brief Show an error dialog.
+        @param message The error message.
+        """
+        self.error_dialog = QDialog(self)
+        self.error_dialog.setWindowTitle("Error")
+        self.error_dialog.setModal(True)
+        self.error_dialog.setFixedSize(300, 100)
+        layout = QVBoxLayout()
+        label = QLabel()
+        label.setWordWrap(True)
+        label.setText(message)
+        label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(label)
+        self.error_dialog.setLayout(layout)
+        self.error_dialog.exec_()
+
+    def checkCoefficients(self, hierarchy):
+        """!
+        @brief Check that the coefficients of a hierarchy can be displayed by the coefficients spin boxes, so that the displayed hierarchy scores the models as the hierarchy itself (e.g. as in report.py and service.py).
+        @param hierarchy The hierarchy.
+        @throw ValueError If a coefficient is not an integer in the range of the spin boxes.
+        """
+        for spin_box, coefficient in ((self.coefficient_category_1_spin_box, hierarchy.coefficient_1), (self.coefficient_category_2_spin_box, hierarchy.coefficient_2)):
+            if not float(coefficient).is_integer() or not spin_box.minimum() <= coefficient <= spin_box.maximum():
+                raise ValueError("The coefficients must be integers between " + str(spin_box.minimum()) + " and " + str(spin_box.maximum()) + ", use the weights of the items for other values.")
+
+    def applyHierarchy(self, hierarchy):
+        """!
+        @brief Display a hierarchy in the categories lists and coefficients spin boxes.
+        @param hierarchy The hierarchy to display.
+        """
+        # The table is updated once the whole hierarchy is displayed, not for each coefficient.
+        for spin_box, coefficient in ((self.coefficient_category_1_spin_box, hierarchy.coefficient_1), (self.coefficient_category_2_spin_box, hierarchy.coefficient_2)):
+            spin_box.blockSignals(True)
+            spin_box.setValue(int(coefficient))
+            spin_box.blockSignals(False)
+        self.category_1_list.clear()
+        self.category_2_list.clear()
+        for value in hierarchy.category_1:
+            self.category_1_list.addItem(value)
+        for value in hierarchy.category_2:
+            self.category_2_list.addItem(value)
+        for category_list in (self.category_1_list, self.category_2_list):
+            for i in range(category_list.count()):
+                item = category_list.item(i)
+                if item.text() in hierarchy.weights:
+                    self.setItemWeight(item, hierarchy.weights[item.text()])
+        self.updateTable()
+
+    def currentHierarchy(self):
+        """!
+        @brief Get the hierarchy currently displayed in the categories lists and coefficients spin boxes.
+        @return The current hierarchy.
+        """
+        weights = {}
+        for category_list in (self.category_1_list, self.category_2_list):
+            for i in range(category_list.count()):
+                item = category_list.item(i)
+                if item.data(Qt.UserRole) is not None:
+                    weights[item.text()] = item.data(Qt.UserRole)
+        return Hierarchy(
+            [self.category_1_list.item(i).text() for i in range(self.category_1_list.count())],
+            [self.category_2_list.item(i).text() for i in range(self.category_2_list.count())],
+            self.coefficient_category_1_spin_box.value(),
+            self.coefficient_category_2_spin_box.value(),
+            weights
+        )
+
+    def setItemWeight(self, item, weight):
+        """!
+        @brief Set the weight of an item of the categories lists, overriding the coefficient of its category.
+        @param item The item of the categories lists.
+        @param weight The weight of the item.
+        """
+        item.setData(Qt.UserRole, weight)
+        item.setToolTip('Weight: ' + str(weight))
+
+    def editItemWeight(self, item):
+        """!
+        @brief Open a dialog to change the weight of an item of the categories lists.
+        @param item The item of the categories lists.
+        """
+        weight, ok = QInputDialog.getDouble(self, "Item weight", "Weight of '" + item.text() + "':", self.currentHierarchy().weightOf(item.text()), -1000, 1000, 2)
+        if ok:
+            self.setItemWeight(item, weight)
+            self.updateTable()
     
     def exportHierarchyJSONFile(self):
         """!
@@ -221,18 +486,8 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         """
         hierarchy, _ = QFileDialog.getSaveFileName(self, "Save Hierarchy File", "", "JSON Files (*.json)")
         if hierarchy:
-            hierarchy_data = {
-                'category_1': {
-                    'coefficient': self.coefficient_category_1_spin_box.value(),
-                    'features': [self.category_1_list.item(i).text() for i in range(self.category_1_list.count())]
-                },
-                'category_2': {
-                    'coefficient': self.coefficient_category_2_spin_box.value(),
-                    'features': [self.category_2_list.item(i).text() for i in range(self.category_2_list.count())]
-                }
-            }
             with open(hierarchy, 'w') as f:
-                json.dump(hierarchy_data, f, indent=4)
+                json.dump(self.currentHierarchy().toJSON(), f, indent=4)
     
     def showAbout(self):
         """!
@@ -258,6 +513,562 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         self.about_dialog.setLayout(layout)
         self.about_dialog.exec_()
     
+    def setupToolsMenu(self):
+        """!
+        @brief Add the tools menu to the menu bar.
+        """
+        self.menuTools = self.menubar.addMenu("Tools")
+        self.actionOptimizeHierarchy = self.menuTools.addAction("Put selected model on top...")
+        self.actionOptimizeHierarchy.triggered.connect(self.optimizeHierarchyForSelectedModel)
+        self.actionCompareHierarchies = self.menuTools.addAction("Compare hierarchies...")
+        self.actionCompareHierarchies.triggered.connect(self.compareHierarchies)
+        self.actionOpenLinkedView = self.menuTools.addAction("Open linked view")
+        self.actionOpenLinkedView.triggered.connect(self.openLinkedView)
+        self.actionNeighbourhood = self.menuTools.addAction("Neighbourhood of selected model...")
+        self.actionNeighbourhood.triggered.connect(self.showNeighbourhood)
+        self.neighbourhood_dialog = None
+        self.actionExportResults = self.menuTools.addAction("Export displayed results...")
+        self.actionExportResults.triggered.connect(self.exportResults)
+        self.export_thread = None
+        self.actionOpenSession = self.menuTools.addAction("Open session...")
+        self.actionOpenSession.triggered.connect(self.selectSessionFile)
+        self.actionSaveSession = self.menuTools.addAction("Save session...")
+        self.actionSaveSession.triggered.connect(self.selectSaveSessionFile)
+        self.menuTools.addSeparator()
+        self.actionWatchCatalog = self.menuTools.addAction("Watch catalog files")
+        self.actionWatchCatalog.setCheckable(True)
+        self.actionWatchCatalog.toggled.connect(self.watchCatalogFiles)
+        self.catalog_watcher = None
+        self.changed_catalog_files = set()
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(100)
+        self.reload_timer.timeout.connect(self.reloadChangedCatalogFiles)
+
+    def setupEditMenu(self):
+        """!
+        @brief Add the edit menu, with the undo/redo of the hierarchy and filters changes, to the menu bar.
+        """
+        self.history = History()
+        self.menuEdit = QMenu("Edit", self.menubar)
+        self.menubar.insertMenu(self.menuAbout.menuAction(), self.menuEdit)
+        self.actionUndo = self.menuEdit.addAction("Undo")
+        self.actionUndo.setShortcut(QKeySequence.Undo)
+        self.actionUndo.triggered.connect(self.undo)
+        self.actionRedo = self.menuEdit.addAction("Redo")
+        self.actionRedo.setShortcut(QKeySequence.Redo)
+        self.actionRedo.triggered.connect(self.redo)
+        self.updateHistoryActions()
+
+    def recordState(self):
+        """!
+        @brief Record the current hierarchy and filters in the history, with the scores of the hierarchy.
+        """
+        hierarchy = self.currentHierarchy()
+        weights, offset = hierarchy.weightVector(self.catalog.labels)
+        self.history.record(hierarchy, self.getFilterState(), self.catalog.scoreKey(weights, offset), self.catalog.score(weights, offset))
+        self.updateHistoryActions()
+
+    def updateHistoryActions(self):
+        """!
+        @brief Enable the undo and redo actions if there is a state to go to.
+        """
+        self.actionUndo.setEnabled(self.history.canUndo())
+        self.actionRedo.setEnabled(self.history.canRedo())
+
+    def undo(self):
+        """!
+        @brief Go back to the previous hierarchy and filters.
+        """
+        if self.history.canUndo():
+            self.restoreState(*self.history.undo())
+
+    def redo(self):
+        """!
+        @brief Go forward to the next hierarchy and filters.
+        """
+        if self.history.canRedo():
+            self.restoreState(*self.history.redo())
+
+    def restoreState(self, hierarchy, filters, scores):
+        """!
+        @brief Display a state of the history, with its stored scores if they were kept.
+        @param hierarchy The hierarchy of the state.
+        @param filters The state of the filters.
+        @param scores The expressiveness and analyzability scores of the hierarchy, None to score the catalog again.
+        """
+        if scores is not None:
+            self.catalog.cacheScores(*hierarchy.weightVector(self.catalog.labels), *scores)
+        self.setFilterState(filters)
+        self.applyHierarchy(hierarchy)
+
+    def openLinkedView(self):
+        """!
+        @brief Open a new view sharing the catalog, the score cache and the selection of this view, starting with its hierarchy and filters.
+        """
+        view = classificationGUI(workspace=self.workspace, source=self)
+        view.setWindowTitle(self.windowTitle() + " (" + str(len(self.workspace.views)) + ")")
+        view.show()
+
+    def closeEvent(self, event):
+        """!
+        @brief Detach the view from its workspace when it is closed.
+        @param event The close event.
+        """
+        self.actionWatchCatalog.setChecked(False)
+        self.workspace.selectionChanged.disconnect(self.showSelection)
+        self.workspace.catalogChanged.disconnect(self.refreshCatalog)
+        if self in self.workspace.views:
+            self.workspace.views.remove(self)
+        super().closeEvent(event)
+
+    def getSelectedModel(self):
+        """!
+        @brief Get the model selected in the table.
+        @return The key of the selected model, None if no model is selected.
+        """
+        selected_row = self.table.currentRow()
+        if selected_row == -1:
+            return None
+        return self.table.item(selected_row, 0).data(Qt.UserRole)
+
+    def optimizeHierarchyForSelectedModel(self):
+        """!
+        @brief Search the hierarchy with the fewest changes from the current one which puts the selected model on top of the displayed models, and propose to apply it.
+        """
+        model = self.getSelectedModel()
+        if model is None:
+            QMessageBox.information(self, "Put selected model on top", "Please select a model in the table.")
+            return
+        objective, ok = QInputDialog.getItem(self, "Put selected model on top", "Rank models by:", ['total', 'expressiveness', 'analyzability'], 0, False)
+        if not ok:
+            return
+        # Only the coefficients the spin boxes can display are tried, so that the applied hierarchy is the optimized one.
+        coefficients = itertools.product(*(range(spin_box.minimum(), spin_box.maximum() + 1) for spin_box in (self.coefficient_category_1_spin_box, self.coefficient_category_2_spin_box)))
+        result = optimizeHierarchy(self.catalog, self.currentHierarchy(), model, self.getModelsToPrint(), objective, list(coefficients))
+        answer = QMessageBox.question(self, "Put selected model on top",
+            "Best rank of " + self.dataflow_models[model]['name'] + ": " + str(result.rank) + " (tied models share a rank, margin: " + str(result.margin) + ")\n"
+            "Coefficients: " + str(result.hierarchy.coefficient_1) + ", " + str(result.hierarchy.coefficient_2) + "\n"
+            "Moved items: " + (', '.join(result.moved) if result.moved else 'none') + "\n\n"
+            "Apply this hierarchy?")
+        if answer == QMessageBox.Yes:
+            self.applyHierarchy(result.hierarchy)
+
+    def watchCatalogFiles(self, enabled):
+        """!
+        @brief Start or stop watching the features, static analyses and classification files, so that their changes are displayed without restarting the GUI.
+        @param enabled True to start watching the files, False to stop.
+        """
+        if enabled:
+            self.catalog_watcher = QFileSystemWatcher([FEATURES_FILE, ANALYZABILITY_FILE, CLASSIFICATION_FILE], self)
+            self.catalog_watcher.fileChanged.connect(self.scheduleCatalogReload)
+        elif self.catalog_watcher is not None:
+            self.catalog_watcher.deleteLater()
+            self.catalog_watcher = None
+
+    def scheduleCatalogReload(self, path):
+        """!
+        @brief Reload a changed catalog file once it has not changed for a short time (editors often write a file in several steps).
+        @param path The path of the changed file.
+        """
+        self.changed_catalog_files.add(path)
+        # Editors saving by replacing the file remove it from the watcher.
+        if self.catalog_watcher is not None and path not in self.catalog_watcher.files() and os.path.exists(path):
+            self.catalog_watcher.addPath(path)
+        self.reload_timer.start()
+
+    def reloadChangedCatalogFiles(self):
+        """!
+        @brief Reload the changed catalog files. A change of the features or static analyses compiles the catalog again, a change of the classification only patches the changed models.
+        """
+        paths = self.changed_catalog_files
+        self.changed_catalog_files = set()
+        start = time.perf_counter()
+        try:
+            if FEATURES_FILE in paths or ANALYZABILITY_FILE in paths:
+                self.reloadVocabulary()
+                message = "Reloaded features and static analyses"
+            else:
+                message = "Reloaded classification: " + str(len(self.reloadClassification())) + " model(s) changed"
+        except (OSError, ValueError) as e:
+            self.statusbar.showMessage("Catalog not reloaded: " + str(e))
+            return
+        self.statusbar.showMessage(message + " in " + str(round(1000 * (time.perf_counter() - start))) + " ms")
+
+    def reloadVocabulary(self):
+        """!
+        @brief Reload the features, static analyses and compile the catalog again. New items are added to category 2 in all the views.
+        """
+        with open(FEATURES_FILE) as f:
+            features = json.load(f)
+        with open(ANALYZABILITY_FILE) as f:
+            analyzability = json.load(f)
+        self.catalog = CompiledCatalog(features, analyzability, self.dataflow_models)
+        self.features = features
+        self.analyzability = analyzability
+        self.workspace.catalogChanged.emit(None)
+
+    def reloadClassification(self):
+        """!
+        @brief Reload the classification and patch the catalog, the tables and the graphs of the views for the changed models only.
+        @return The changed models (key to description, or to None for a removed model).
+        @throw ValueError If the classification is not valid.
+        """
+        # The models are compared one after the other while the file is read, only the changed ones are kept.
+        changes = {}
+        keys = set()
+        with open(CLASSIFICATION_FILE) as f:
+            for key, model in iterJSONObject(f):
+                keys.add(key)
+                if self.dataflow_models.get(key) == model:
+                    # The last description of a key is the one kept, as with json.load().
+                    changes.pop(key, None)
+                else:
+                    checkModel(model)
+                    changes[key] = model
+        changes.update({k: None for k in self.dataflow_models if k not in keys})
+        if changes:
+            # The models are replaced once the catalog is patched, so that a failed reload leaves the views unchanged. The order of the models is kept.
+            updated = dict(self.dataflow_models)
+            for key, model in changes.items():
+                if model is None:
+                    del updated[key]
+                else:
+                    updated[key] = model
+            self.catalog.patch(changes)
+            self.dataflow_models = updated
+            self.workspace.catalogChanged.emit(changes)
+        return changes
+
+    def refreshCatalog(self, changes):
+        """!
+        @brief Update the view after the shared catalog changed.
+        @param changes The changed models (key to description, or to None for a removed model), None if the features and static analyses changed.
+        """
+        self.history.discardScores()
+        if changes is None:
+            hierarchy = self.currentHierarchy()
+            for label in self.catalog.labels:
+                if label not in hierarchy.category_1 and label not in hierarchy.category_2:
+                    self.category_2_list.addItem(label)
+            self.updateTable()
+        else:
+            self.patchTable(changes)
+            self.updateGraph()
+        # The rows moved, the selection is shown again and cleared if the selected model was removed.
+        if self.workspace.selected_model not in self.catalog.index:
+            self.workspace.selected_model = None
+        self.showSelection(self.workspace.selected_model)
+
+    def patchTable(self, models):
+        """!
+        @brief Update the rows of the table of some models only.
+        @param models The keys of the models to update.
+        """
+        mask = self.getFilterMask()
+        displayed = [m for m in models if m in self.catalog.index and mask[self.catalog.index[m]]]
+        expressiveness, analyzability = self.scoreModels(displayed)
+        scores = {m: (e, a) for m, e, a in zip(displayed, expressiveness, analyzability)}
+        self.table.setSortingEnabled(False)
+        for model in models:
+            item = self.table_items.get(model)
+            if model in scores:
+                if item is None:
+                    self.table.insertRow(self.table.rowCount())
+                    row = self.table.rowCount() - 1
+                else:
+                    row = self.table.row(item)
+                self.setTableRow(row, model, *scores[model])
+            elif item is not None:
+                self.table.removeRow(self.table.row(item))
+                del self.table_items[model]
+        self.table.setSortingEnabled(True)
+
+    def compareHierarchies(self):
+        """!
+        @brief Open a file dialog to select several JSON hierarchy files and show the correlation between the rankings of the displayed models they give.
+        """
+        files, _ = QFileDialog.getOpenFileNames(self, "Open Hierarchy Files", "", "JSON Files (*.json)")
+        hierarchies = []
+        names = []
+        invalid = []
+        for file in files:
+            try:
+                hierarchies.append(Hierarchy.load(file, self.catalog.labels))
+                names.append(os.path.basename(file))
+            except ValueError:
+                invalid.append(os.path.basename(file))
+        if invalid:
+            self.showError("The following JSON files are not valid: " + ', '.join(invalid))
+        if len(hierarchies) < 2:
+            return
+        self.showComparison(names, scoreHierarchies(self.catalog, hierarchies, self.getModelsToPrint()))
+
+    def showComparison(self, names, scores):
+        """!
+        @brief Show the heatmap of the correlation between the rankings given by several hierarchies.
+        @param names The names of the hierarchies.
+        @param scores The scores of the displayed models given by each hierarchy, an array of shape (models, hierarchies).
+        """
+        self.comparison_dialog = QDialog(self)
+        self.comparison_dialog.setWindowTitle("Compare hierarchies")
+        self.comparison_dialog.resize(700, 650)
+        layout = QVBoxLayout()
+        controls = QHBoxLayout()
+        metric_combo_box = QComboBox()
+        metric_combo_box.addItems(['Kendall tau', 'Spearman', 'Top-k overlap'])
+        k_spin_box = QSpinBox()
+        k_spin_box.setPrefix('k = ')
+        k_spin_box.setRange(1, max(1, scores.shape[0]))
+        k_spin_box.setValue(min(5, scores.shape[0]))
+        controls.addWidget(metric_combo_box)
+        controls.addWidget(k_spin_box)
+        layout.addLayout(controls)
+        heatmap = pg.PlotWidget()
+        heatmap.setBackground('w')
+        heatmap.invertY(True)
+        heatmap.setAspectLocked(True)
+        ticks = [[(i + 0.5, name) for i, name in enumerate(names)]]
+        for axis in ('left', 'bottom'):
+            heatmap.getAxis(axis).setPen('k')
+            heatmap.getAxis(axis).setTicks(ticks)
+        heatmap.getAxis('left').setWidth(min(300, 20 + 9 * max(len(name) for name in names)))
+        image = pg.ImageItem()
+        heatmap.addItem(image)
+        heatmap.addColorBar(image, colorMap='viridis', values=(-1, 1))
+        layout.addWidget(heatmap)
+
+        def updateHeatmap():
+            metric = metric_combo_box.currentText()
+            if metric == 'Kendall tau':
+                matrix = kendallTauMatrix(scores)
+            elif metric == 'Spearman':
+                matrix = spearmanMatrix(scores)
+            else:
+                matrix = topKOverlapMatrix(scores, k_spin_box.value())
+            image.setImage(np.nan_to_num(matrix), levels=(-1, 1))
+
+        metric_combo_box.currentIndexChanged.connect(updateHeatmap)
+        k_spin_box.valueChanged.connect(updateHeatmap)
+        updateHeatmap()
+        self.comparison_dialog.setLayout(layout)
+        self.comparison_dialog.show()
+
+    def exportResults(self):
+        """!
+        @brief Open a file dialog to export the displayed models with their scores, rank and attributes, and write the file in the background.
+        """
+        if self.export_thread is not None:
+            QMessageBox.information(self, "Export displayed results", "An export is already running.")
+            return
+        filters = {'csv': "CSV Files (*.csv)", 'jsonl': "JSON Lines Files (*.jsonl)", 'parquet': "Parquet Files (*.parquet)"}
+        formats = availableFormats()
+        path, selected_filter = QFileDialog.getSaveFileName(self, "Export Displayed Results", "", ';;'.join(filters[f] for f in formats))
+        if not path:
+            return
+        format = next(f for f in formats if filters[f] == selected_filter) if selected_filter else formats[0]
+        if not path.endswith(FORMATS[format]):
+            path += FORMATS[format]
+        weights, offset = self.currentHierarchy().weightVector(self.catalog.labels)
+        expressiveness, analyzability = self.catalog.score(weights, offset)
+        # The descriptions are copied so that a reload of the classification during the export does not change them.
+        export = ResultsExport(self.catalog, dict(self.dataflow_models), np.flatnonzero(self.getFilterMask()), expressiveness, analyzability)
+        progress_dialog = QProgressDialog("Exporting " + str(len(export)) + " models...", "Cancel", 0, EXPORT_PROGRESS_STEPS, self)
+        progress_dialog.setWindowTitle("Export displayed results")
+        progress_dialog.setMinimumDuration(500)
+        self.export_thread = ExportThread(export, path, format, self)
+        self.export_thread.progress.connect(lambda written, total: progress_dialog.setValue(EXPORT_PROGRESS_STEPS * written // max(total, 1)))
+        progress_dialog.canceled.connect(self.export_thread.requestInterruption)
+
+        def exportFinished():
+            thread = self.export_thread
+            self.export_thread = None
+            progress_dialog.reset()
+            if thread.error is not None:
+                self.showError("The results were not exported: " + thread.error)
+            elif thread.completed:
+                self.statusbar.showMessage("Exported " + str(len(export)) + " models to " + path)
+            else:
+                self.statusbar.showMessage("Export cancelled")
+
+        self.export_thread.finished.connect(exportFinished)
+        self.export_thread.start()
+
+    def getFilterState(self):
+        """!
+        @brief Get the state of the filters.
+        @return The labels of the checked features and static analyses, the All/Any radio buttons and the Turing classes checkboxes.
+        """
+        return {
+            'features': [child.text() for child in self.features_frame.findChildren(QCheckBox) if child.isChecked()],
+            'all_features': self.isAllFeatureRadioButtonChecked(),
+            'analyzability': [child.text() for child in self.analyzability_frame.findChildren(QCheckBox) if child.isChecked()],
+            'all_analyzability': self.isAllAnalyzabilityRadioButtonChecked(),
+            'non_turing_complete': self.show_non_turing_complete_check_box.isChecked(),
+            'turing_complete': self.show_turing_complete_check_box.isChecked(),
+            'meta_models': self.show_meta_models_check_box.isChecked()
+        }
+
+    def setFilterState(self, state):
+        """!
+        @brief Set the state of the filters, without updating the table.
+        @param state The state of the filters, as returned by getFilterState().
+        """
+        features = set(state.get('features', []))
+        analyzability = set(state.get('analyzability', []))
+        for child in self.features_frame.findChildren(QCheckBox):
+            child.setChecked(child.text() in features)
+        for child in self.analyzability_frame.findChildren(QCheckBox):
+            child.setChecked(child.text() in analyzability)
+        self.all_radio_button_features.setChecked(state.get('all_features', False))
+        self.any_radio_button_features.setChecked(not state.get('all_features', False))
+        self.all_radio_button_analyzability.setChecked(state.get('all_analyzability', False))
+        self.any_radio_button_analyzability.setChecked(not state.get('all_analyzability', False))
+        self.show_non_turing_complete_check_box.setChecked(state.get('non_turing_complete', True))
+        self.show_turing_complete_check_box.setChecked(state.get('turing_complete', True))
+        self.show_meta_models_check_box.setChecked(state.get('meta_models', True))
+
+    def selectModel(self, model):
+        """!
+        @brief Select a model in all the views sharing the workspace.
+        @param model The key of the model, None to clear the selection.
+        """
+        self.workspace.select(model)
+
+    def showSelection(self, model):
+        """!
+        @brief Select a model in the table if it is displayed, highlight it in the graph and display its description.
+        @param model The key of the model, None to clear the selection.
+        """
+        item = self.table_items.get(model)
+        self.table.setCurrentCell(self.table.row(item) if item is not None else -1, 0)
+        self.updateHighlight()
+        self.updateDescription()
+        self.updateNeighbourhood()
+
+    def selectSaveSessionFile(self):
+        """!
+        @brief Open a file dialog to save the session.
+        """
+        path, _ = QFileDialog.getSaveFileName(self, "Save Session File", "", "Session Files (*.npz)")
+        if path:
+            try:
+                self.saveSession(path)
+            except OSError as e:
+                self.showError("The session was not saved: " + str(e))
+
+    def saveSession(self, path):
+        """!
+        @brief Save the filters, the hierarchy, the selected model and the displayed scores to a session file.
+        @param path The path of the session file.
+        """
+        hierarchy = self.currentHierarchy()
+        expressiveness, analyzability = self.catalog.score(*hierarchy.weightVector(self.catalog.labels))
+        Session(self.getFilterState(), hierarchy.toJSON(), self.getSelectedModel(), self.catalog.fingerprint(), expressiveness, analyzability).save(path)
+        self.statusbar.showMessage("Session saved to " + path)
+
+    def selectSessionFile(self):
+        """!
+        @brief Open a file dialog to select a session file.
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "Open Session File", "", "Session Files (*.npz)")
+        if path:
+            self.openSession(path)
+
+    def openSession(self, path):
+        """!
+        @brief Restore the view from a session file. The stored scores are displayed without scoring the catalog again if the catalog has not changed since the session was saved.
+        @param path The path of the session file.
+        @return True if the session was restored, False otherwise.
+        """
+        try:
+            session = Session.load(path)
+            hierarchy = Hierarchy.fromJSON(session.hierarchy, self.catalog.labels)
+            self.checkCoefficients(hierarchy)
+        except ValueError as e:
+            self.showError("The session file is not valid: " + str(e))
+            return False
+        cached = session.catalog_hash == self.catalog.fingerprint() and len(session.expressiveness) == len(self.catalog)
+        if cached:
+            self.catalog.cacheScores(*hierarchy.weightVector(self.catalog.labels), session.expressiveness, session.analyzability)
+        self.setFilterState(session.filters)
+        self.applyHierarchy(hierarchy)
+        self.selectModel(session.selected_model if session.selected_model in self.catalog.index else None)
+        self.statusbar.showMessage("Session restored" + (" from its stored scores" if cached else ", the catalog changed since it was saved"))
+        return True
+
+    def showNeighbourhood(self):
+        """!
+        @brief Show the dialog listing the models dominating the selected model, the models it dominates and its nearest neighbours. The dialog follows the selection of the table.
+        """
+        if self.neighbourhood_dialog is None:
+            self.neighbourhood_dialog = QDialog(self)
+            self.neighbourhood_dialog.setWindowTitle("Neighbourhood of selected model")
+            self.neighbourhood_dialog.resize(900, 500)
+            layout = QVBoxLayout()
+            controls = QHBoxLayout()
+            self.neighbourhood_label = QLabel()
+            self.neighbours_spin_box = QSpinBox()
+            self.neighbours_spin_box.setPrefix('k = ')
+            self.neighbours_spin_box.setRange(1, NEIGHBOURHOOD_LIST_SIZE)
+            self.neighbours_spin_box.setValue(10)
+            self.neighbours_spin_box.valueChanged.connect(self.updateNeighbourhood)
+            controls.addWidget(self.neighbourhood_label)
+            controls.addStretch()
+            controls.addWidget(self.neighbours_spin_box)
+            layout.addLayout(controls)
+            lists = QHBoxLayout()
+            self.neighbourhood_lists = []
+            for _ in range(3):
+                column = QVBoxLayout()
+                title = QLabel()
+                model_list = QListWidget()
+                model_list.itemDoubleClicked.connect(lambda item: self.selectModel(item.data(Qt.UserRole)))
+                column.addWidget(title)
+                column.addWidget(model_list)
+                lists.addLayout(column)
+                self.neighbourhood_lists.append((title, model_list))
+            layout.addLayout(lists)
+            self.neighbourhood_dialog.setLayout(layout)
+        self.neighbourhood_dialog.show()
+        self.updateNeighbourhood()
+
+    def updateNeighbourhood(self):
+        """!
+        @brief Update the neighbourhood dialog, if it is shown, for the selected model among the displayed models.
+        """
+        if self.neighbourhood_dialog is None or not self.neighbourhood_dialog.isVisible():
+            return
+        model = self.getSelectedModel()
+        if model is None or model not in self.catalog.index:
+            self.neighbourhood_label.setText("Select a model in the table.")
+            for title, model_list in self.neighbourhood_lists:
+                title.clear()
+                model_list.clear()
+            return
+        position = self.catalog.index[model]
+        candidates = np.flatnonzero(self.getFilterMask())
+        expressiveness, analyzability = self.catalog.score(*self.currentHierarchy().weightVector(self.catalog.labels))
+        dominating, dominated = dominance(expressiveness, analyzability, position, candidates)
+        neighbours, distances = nearestNeighbours(self.catalog, position, candidates, self.neighbours_spin_box.value())
+        self.neighbourhood_label.setText(self.catalog.names[position] + " (expressiveness " + formatValue(expressiveness[position]) + ", analyzability " + formatValue(analyzability[position]) + ")")
+        contents = (
+            ("Dominated by " + str(len(dominating)) + " model(s)", dominating, None),
+            ("Dominates " + str(len(dominated)) + " model(s)", dominated, None),
+            (str(len(neighbours)) + " nearest neighbour(s) (Jaccard distance)", neighbours, distances)
+        )
+        for (title, model_list), (text, positions, model_distances) in zip(self.neighbourhood_lists, contents):
+            title.setText(text)
+            model_list.clear()
+            for i, p in enumerate(positions[:NEIGHBOURHOOD_LIST_SIZE].tolist()):
+                if model_distances is None:
+                    details = formatValue(expressiveness[p]) + ", " + formatValue(analyzability[p])
+                else:
+                    details = str(round(float(model_distances[i]), 3))
+                item = QListWidgetItem(self.catalog.names[p] + " (" + details + ")")
+                item.setData(Qt.UserRole, self.catalog.keys[p])
+                model_list.addItem(item)
+
     def connectSignalsSlots(self):
         """!
         @brief Connect the signals and slots of the GUI.
@@ -267,10 +1078,11 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         self.show_meta_models_check_box.clicked.connect(self.updateTable)
         self.coefficient_category_1_spin_box.valueChanged.connect(self.updateTable)
         self.coefficient_category_2_spin_box.valueChanged.connect(self.updateTable)
-        self.table.clicked.connect(self.updateGraph)
-        self.table.clicked.connect(self.updateDescription)
+        self.table.clicked.connect(lambda: self.selectModel(self.getSelectedModel()))
         self.right_button.clicked.connect(self.moveRight)
         self.left_button.clicked.connect(self.moveLeft)
+        self.category_1_list.itemDoubleClicked.connect(self.editItemWeight)
+        self.category_2_list.itemDoubleClicked.connect(self.editItemWeight)
         for child in self.features_frame.findChildren(QCheckBox):
             child.clicked.connect(self.updateTable)
         for child in self.group_radio_button_features.findChildren(QRadioButton):
@@ -282,6 +1094,29 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
     
     def getModelsToPrint(self):
         """Get the dataflow models to print based on the selected checkboxes and radio buttons."""
+        return [self.catalog.keys[i] for i in np.flatnonzero(self.getFilterMask())]
+
+    def getFilterMask(self):
+        """!
+        @brief Get the dataflow models matching the selected checkboxes and radio buttons with the index of the compiled catalog.
+        @return A boolean array over the models of the catalog.
+        """
+        turing_classes = []
+        if self.show_non_turing_complete_check_box.isChecked():
+            turing_classes.append(NON_TURING_COMPLETE)
+        if self.show_turing_complete_check_box.isChecked():
+            turing_classes.append(TURING_COMPLETE)
+        if self.show_meta_models_check_box.isChecked():
+            turing_classes.append(META_MODEL)
+        features = [self.getFeatureAbreviation(child.text()) for child in self.features_frame.findChildren(QCheckBox) if child.isChecked()]
+        analyzability = [self.getAnalyzabilityAbreviation(child.text()) for child in self.analyzability_frame.findChildren(QCheckBox) if child.isChecked()]
+        return self.catalog.filterMask(features, self.isAllFeatureRadioButtonChecked(), analyzability, self.isAllAnalyzabilityRadioButtonChecked(), turing_classes)
+
+    def getModelsToPrintReference(self):
+        """!
+        @brief Get the dataflow models to print based on the selected checkboxes and radio buttons, model after model.
+        @note This is the per-model reference implementation of the filters, the table and the graph use getFilterMask().
+        """
         modelsToPrint = []
         if self.show_non_turing_complete_check_box.isChecked():
             nonTuringModels = self.getNonTuringModels
@@ -356,9 +1191,21 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         """Get the abbreviation of the static analysis."""
         return next((k for k, v in self.analyzability.items() if v == analyzability), None)
 
+    def scoreModels(self, models):
+        """!
+        @brief Get the expressiveness and analyzability scores of the printed models with the compiled catalog, i.e. with one sparse matrix-vector product for any weighting of the current hierarchy.
+        @param models The models for which the scores are calculated.
+        @return A list of expressiveness scores and a list of analyzability scores for the printed models.
+        """
+        weights, offset = self.currentHierarchy().weightVector(self.catalog.labels)
+        expressiveness, analyzability = self.catalog.score(weights, offset)
+        indices = self.catalog.indicesOf(models)
+        return expressiveness[indices].tolist(), analyzability[indices].tolist()
+
     def getExpressivenessScore(self, models):
         """!
         @brief Get the expressiveness score of the printed models based on the selected features and static analyses.
+        @note This is the per-model reference implementation of the two-category hierarchy, the table and the graph use scoreModels().
         @param models The models for which the expressiveness score is calculated.
         @return A list of expressiveness scores for the printed models.
         """
@@ -459,6 +1306,7 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         @brief Get the analyzability score of the printed models based on the selected static analyses.
         @param models The for which the analyzability score is calculated.
         @return A list of analyzability scores for the printed models.
+        @note This is the per-model reference implementation of the two-category hierarchy, the table and the graph use scoreModels().
         """
         analyzability_score = []
         for model in models:
@@ -474,43 +1322,45 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         @brief Update the summary list and the graph with the selected dataflow models.
         """
         models = self.getModelsToPrint()
-        expressiveness = self.getExpressivenessScore(models)
-        analyzability = self.getAnalyzability(models)
+        expressiveness, analyzability = self.scoreModels(models)
         self.fillTable(models, expressiveness, analyzability)
         self.updateGraph()
+        self.updateNeighbourhood()
+        self.recordState()
     
     def updateGraph(self):
         """!
         @brief Update the graph with the selected dataflow models and highlight the selected model.
         """
-        models = self.getModelsToPrint()
-        expressiveness = self.getExpressivenessScore(models)
-        analyzability = self.getAnalyzability(models)
-        modelsWithExpressivenessAndAnalyzability = {}
-        for m, e, a in zip(models, expressiveness, analyzability):
-            modelsWithExpressivenessAndAnalyzability[m] = {'expressiveness': e, 'analyzability': a}
-        selected_row = self.table.currentRow()
-        if selected_row == -1:
-            self.fillGraph(modelsWithExpressivenessAndAnalyzability)
+        expressiveness, analyzability = self.catalog.score(*self.currentHierarchy().weightVector(self.catalog.labels))
+        mask = self.getFilterMask()
+        self.points.setData(expressiveness[mask], analyzability[mask])
+        self.updateHighlight()
+
+    def updateHighlight(self):
+        """!
+        @brief Highlight the selected model in the graph.
+        """
+        model = self.getSelectedModel()
+        if model is None:
+            self.highlighted_point.setData([], [])
         else:
-            selected_model = self.table.item(selected_row, 0).text()
-            highlight = next((k for k, v in self.dataflow_models.items() if v['name'] == selected_model), None)
-            self.fillGraph(modelsWithExpressivenessAndAnalyzability, highlight=highlight)
+            expressiveness, analyzability = self.catalog.score(*self.currentHierarchy().weightVector(self.catalog.labels))
+            position = self.catalog.index[model]
+            self.highlighted_point.setData([expressiveness[position]], [analyzability[position]])
     
     def updateDescription(self):
         """!
         @brief Update the description of the selected model in the table (features, static analyses, rate updates, topology updates, domain rate).
         """
-        selected_row = self.table.currentRow()
-        if selected_row == -1:
+        model = self.getSelectedModel()
+        if model is None:
             self.rate_updates_content_label.setText('N/A')
             self.topology_updates_content_label.setText('N/A')
             self.domain_rate_content_label.setText('N/A')
             self.features_content_label.setText('N/A')
             self.analyzability_content_label.setText('N/A')
         else:
-            selected_model = self.table.item(selected_row, 0).text()
-            model = next((k for k, v in self.dataflow_models.items() if v['name'] == selected_model), None)
             self.rate_updates_content_label.setText(', '.join(self.dataflow_models[model]['rate_updates']))
             self.topology_updates_content_label.setText(', '.join(self.dataflow_models[model]['topology_updates']))
             self.domain_rate_content_label.setText(self.dataflow_models[model]['range_rate'])
@@ -525,46 +1375,41 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
         @param analyzability The analyzability scores of the models.
         """
         self.table.setRowCount(len(models))
+        self.table_items = {}
         self.table.setSortingEnabled(False) # https://stackoverflow.com/questions/7960505/strange-qtablewidget-behavior-not-all-cells-populated-after-sorting-followed-b
         for i, model in enumerate(models):
-            self.table.setItem(i, 0, QTableWidgetItem(str(self.dataflow_models[model]['name'])))
-            if expressiveness[i] < 10:
-                self.table.setItem(i, 1, QTableWidgetItem("0" + str(expressiveness[i])))
-            else:
-                self.table.setItem(i, 1, QTableWidgetItem(str(expressiveness[i])))
-            if analyzability[i] < 10:
-                self.table.setItem(i, 2, QTableWidgetItem("0" + str(analyzability[i])))
-            else:
-                self.table.setItem(i, 2, QTableWidgetItem(str(analyzability[i])))
+            self.setTableRow(i, model, expressiveness[i], analyzability[i])
         self.table.setSortingEnabled(True)
-    
-    def fillGraph(self, data, highlight=None):
+
+    def setTableRow(self, row, model, expressiveness, analyzability):
         """!
-        @brief Fill the graph with the selected dataflow models.
-        @param data The data to fill the graph with which contains the expressiveness and analyzability scores of the models.
-        @param highlight The model to highlight in the graph.
+        @brief Fill a row of the table with a dataflow model.
+        @param row The row of the table.
+        @param model The model to fill the row with.
+        @param expressiveness The expressiveness score of the model.
+        @param analyzability The analyzability score of the model.
         """
-        self.graph.clear()
-        expressiveness = [v['expressiveness'] for v in data.values()]
-        analyzability = [v['analyzability'] for v in data.values()]
-        self.graph.plot(expressiveness, analyzability, pen=None, symbol='+', symbolPen=None, symbolBrush='black')
-        if highlight:
-            self.graph.plot([data[highlight]['expressiveness']], [data[highlight]['analyzability']], pen=None, symbol='o', symbolPen=None, symbolBrush='red')
+        item = QTableWidgetItem(str(self.dataflow_models[model]['name']))
+        item.setData(Qt.UserRole, model)
+        self.table.setItem(row, 0, item)
+        self.table_items[model] = item
+        self.table.setItem(row, 1, ScoreItem(expressiveness))
+        self.table.setItem(row, 2, ScoreItem(analyzability))
     
     def moveRight(self):
         """!
         @brief Move the selected item from category 1 to category 2.
         """
-        self.category_2_list.addItems([str(item.text()) for item in self.category_1_list.selectedItems()])
-        self.category_1_list.takeItem(self.category_1_list.currentRow())
+        for item in self.category_1_list.selectedItems():
+            self.category_2_list.addItem(self.category_1_list.takeItem(self.category_1_list.row(item)))
         self.updateTable()
     
     def moveLeft(self):
         """!
         @brief Move the selected item from category 2 to category 1.
         """
-        self.category_1_list.addItems([str(item.text()) for item in self.category_2_list.selectedItems()])
-        self.category_2_list.takeItem(self.category_2_list.currentRow())
+        for item in self.category_2_list.selectedItems():
+            self.category_1_list.addItem(self.category_2_list.takeItem(self.category_2_list.row(item)))
         self.updateTable()
 
     @property
@@ -584,9 +1429,9 @@ class classificationGUI(QMainWindow, Ui_MainWindow):
 
 class MyApp(QApplication):
 
-    def __init__(self, *args):
-        super().__init__(*args)
-        self.window = classificationGUI()
+    def __init__(self, argv, session=None):
+        super().__init__(argv)
+        self.window = classificationGUI(session=session)
         self.show()
     
     def show(self):
@@ -595,6 +1440,7 @@ class MyApp(QApplication):
 if __name__ == "__main__": 
     parser = argparse.ArgumentParser(description='Dataflow models classification')
     parser.add_argument('--hierarchy', type=str, default='resources/hierarchy-example.json', help='Initialize the visualization with an existing classification')
+    parser.add_argument('--session', type=str, default=None, help='Restore a session file saved from the tools menu')
     args = parser.parse_args()
-    myapp = MyApp([args.hierarchy])
+    myapp = MyApp([args.hierarchy], args.session)
     sys.exit(myapp.exec())
\ No newline at end of file
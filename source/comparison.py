@@ -0,0 +1,106 @@
+"""!
+@file comparison.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the comparison of the rankings of the dataflow models given by several hierarchies.
+"""
+
+import numpy as np
+
+from catalog import objectiveScore
+
+## Number of models scored at once by scoreHierarchies().
+BATCH_SIZE = 65536
+## Number of pairs of models processed at once by kendallTauMatrix().
+PAIRS_CHUNK_SIZE = 65536
+
+
+def scoreHierarchies(catalog, hierarchies, models, objective='total', batch_size=BATCH_SIZE):
+    """!
+    @brief Score the models with several hierarchies in a single batched product.
+    @param catalog The compiled catalog.
+    @param hierarchies The hierarchies.
+    @param models The keys of the models to score.
+    @param objective The score ranking the models: 'expressiveness', 'analyzability' or 'total' (sum of both).
+    @param batch_size The number of models scored at once, which bounds the memory used by the product.
+    @return An array of shape (models, hierarchies).
+    """
+    vectors = [h.weightVector(catalog.labels) for h in hierarchies]
+    weights = np.stack([v for v, _ in vectors], axis=1).reshape(len(catalog.labels), len(vectors))
+    offsets = np.array([o for _, o in vectors], dtype=np.float64)
+    positions = catalog.indicesOf(models)
+    scores = np.empty((len(positions), len(vectors)))
+    for start in range(0, len(positions), batch_size):
+        batch = positions[start:start + batch_size]
+        result = catalog.product(weights, np.stack([2 * batch, 2 * batch + 1], axis=1).ravel())
+        scores[start:start + batch_size] = objectiveScore(result[0::2] + offsets, result[1::2], objective)
+    return scores
+
+
+def rankDescending(scores):
+    """!
+    @brief Rank the models of each hierarchy from the best score, tied models share the best of their ranks.
+    @param scores An array of shape (models, hierarchies).
+    @return The ranks (from 1, the highest score), an array of shape (models, hierarchies).
+    """
+    ranks = np.empty(scores.shape, dtype=np.int64)
+    for j in range(scores.shape[1]):
+        ranks[:, j] = len(scores) - np.searchsorted(np.sort(scores[:, j]), scores[:, j], 'right') + 1
+    return ranks
+
+
+def rankData(scores):
+    """!
+    @brief Rank the models of each hierarchy, tied models get the average of their ranks.
+    @param scores An array of shape (models, hierarchies).
+    @return The ranks (from 1, the lowest score), an array of shape (models, hierarchies).
+    """
+    ranks = np.empty(scores.shape)
+    for j in range(scores.shape[1]):
+        ordered = np.sort(scores[:, j])
+        ranks[:, j] = (np.searchsorted(ordered, scores[:, j], 'left') + np.searchsorted(ordered, scores[:, j], 'right') + 1) / 2
+    return ranks
+
+
+def spearmanMatrix(scores):
+    """!
+    @brief Compute the Spearman correlation between the rankings of every pair of hierarchies.
+    @param scores An array of shape (models, hierarchies).
+    @return An array of shape (hierarchies, hierarchies), NaN when a ranking is constant.
+    """
+    ranks = rankData(scores)
+    ranks -= ranks.mean(axis=0)
+    norms = np.sqrt((ranks ** 2).sum(axis=0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (ranks.T @ ranks) / np.outer(norms, norms)
+
+
+def kendallTauMatrix(scores):
+    """!
+    @brief Compute the Kendall tau-b correlation between the rankings of every pair of hierarchies.
+    @param scores An array of shape (models, hierarchies).
+    @return An array of shape (hierarchies, hierarchies), NaN when a ranking is constant.
+    """
+    first, second = np.triu_indices(scores.shape[0], 1)
+    concordance = np.zeros((scores.shape[1], scores.shape[1]))
+    for start in range(0, len(first), PAIRS_CHUNK_SIZE):
+        signs = np.sign(scores[first[start:start + PAIRS_CHUNK_SIZE]] - scores[second[start:start + PAIRS_CHUNK_SIZE]])
+        concordance += signs.T @ signs
+    norms = np.sqrt(np.diag(concordance))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return concordance / np.outer(norms, norms)
+
+
+def topKOverlapMatrix(scores, k):
+    """!
+    @brief Compute the overlap between the k best models of every pair of hierarchies.
+    @param scores An array of shape (models, hierarchies).
+    @param k The number of best models compared.
+    @return An array of shape (hierarchies, hierarchies), the fraction of the k best models shared by both hierarchies.
+    """
+    k = max(1, min(k, scores.shape[0]))
+    best = np.argsort(-scores, axis=0, kind='stable')[:k]
+    membership = np.zeros((scores.shape[1], scores.shape[0]))
+    membership[np.arange(scores.shape[1]), best] = 1
+    return (membership @ membership.T) / k
@@ -0,0 +1,383 @@
+"""!
+@file differential.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the differential test harness checking that a scoring and filtering engine gives exactly the results of the per-model reference implementation of the GUI.
+
+The reference is the original code of the GUI (getModelsToPrintReference(), which relies on hasSelectedFeatures() and hasCheckedAnalyzability(), getExpressivenessScore(), getRateRangeScore(), getRateTopologyUpdatesScore() and getAnalyzability()), run on a hidden window with the offscreen Qt platform. Random cases (catalog, two-category hierarchy and filters) are generated, including the quirks of the original data: items listed twice in a category (e.g. "Domain rate" in `resources/hierarchy-example.json`), labels matching no item (e.g. the "Sliding window" checkbox while `resources/features.json` has "Sliding windows") and abbreviations matching no item (e.g. "inidisit"). The first case is the catalog, hierarchy and initial filters of the GUI. A failing case is shrunk to a minimal failing example, which is printed (and saved with `-o`).
+
+Usage:
+```bash
+python3 source/differential.py --cases 500 --seed 1
+python3 source/differential.py --engine catalog
+python3 source/differential.py --engine mymodule:myEngine
+```
+An engine is a function taking a Case and returning a dictionary mapping the keys of the displayed models to their (expressiveness, analyzability) scores.
+"""
+
+import os
+import sys
+import copy
+import json
+import random
+import argparse
+import importlib
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication, QCheckBox
+
+from catalog import CompiledCatalog, DOMAIN_RATE, RATE_TOPOLOGY_DYNAMISM, RATE_RANGE_LEVELS, UPDATE_LEVELS, NON_TURING_COMPLETE, TURING_COMPLETE, META_MODEL
+from hierarchy import Hierarchy
+
+## Maximum number of models of a random catalog.
+MAX_MODELS = 12
+## Labels which match no item of the catalog, including the labels of the filter box which differ from the catalog.
+UNKNOWN_LABELS = ['Sliding window', 'Initi. and disc. of it', 'Unknown item']
+## Abbreviations which match no item of the catalog.
+UNKNOWN_ABBREVIATIONS = ['inidisit', 'unknown']
+## Range rates of the random models, including an unknown one.
+RANGE_RATES = list(RATE_RANGE_LEVELS) + ['Z']
+## Update policies of the random models, including an unknown one.
+UPDATES = list(UPDATE_LEVELS) + ['sometimes']
+## Default values of the boolean filters, which a shrunk case tends to.
+FILTER_DEFAULTS = (('all_features', False), ('all_analyzability', False), ('non_turing_complete', True), ('turing_complete', True), ('meta_models', True))
+## Default values of the scalar properties of a model, which a shrunk case tends to.
+MODEL_DEFAULTS = (('rate_updates', ['never']), ('topology_updates', ['never']), ('range_rate', '{1}'), ('turing_complete', False))
+
+
+class Case:
+    """!
+    @brief This class describes a case of the harness: a catalog, a two-category hierarchy and the state of the filter box.
+    """
+
+    def __init__(self, features, analyzability, dataflow_models, category_1, category_2, coefficient_1, coefficient_2, filters):
+        """!
+        @brief Create a case.
+        @param features The features (abbreviation to name).
+        @param analyzability The static analyses (abbreviation to name).
+        @param dataflow_models The dataflow models (key to description).
+        @param category_1 The items of category 1.
+        @param category_2 The items of category 2.
+        @param coefficient_1 The coefficient of category 1.
+        @param coefficient_2 The coefficient of category 2.
+        @param filters The state of the filter box (cf. classificationGUI.getFilterState()).
+        """
+        self.features = features
+        self.analyzability = analyzability
+        self.dataflow_models = dataflow_models
+        self.category_1 = category_1
+        self.category_2 = category_2
+        self.coefficient_1 = coefficient_1
+        self.coefficient_2 = coefficient_2
+        self.filters = filters
+
+    def toJSON(self):
+        """!
+        @brief Get the content of the case, with the structure of the JSON files of the GUI.
+        @return The content of the case.
+        """
+        return {
+            'features': self.features,
+            'analyzability': self.analyzability,
+            'classification': self.dataflow_models,
+            'hierarchy': Hierarchy(self.category_1, self.category_2, self.coefficient_1, self.coefficient_2).toJSON(),
+            'filters': self.filters
+        }
+
+    def size(self):
+        """!
+        @brief Get the size of the case, which decreases with each simplification of shrinkCandidates(): the number of models, catalog items, hierarchy items and checked filters, then the number of values differing from their default.
+        @return The size of the case, compared lexicographically.
+        """
+        structure = len(self.features) + len(self.analyzability) + len(self.category_1) + len(self.category_2) + len(self.filters['features']) + len(self.filters['analyzability'])
+        distance = (self.coefficient_1 != 1) + (self.coefficient_2 != 1)
+        distance += sum(self.filters[name] != default for name, default in FILTER_DEFAULTS)
+        for model in self.dataflow_models.values():
+            structure += 1 + sum(len(model[name]) for name in ('features', 'analyzability', 'rate_updates', 'topology_updates'))
+            distance += sum(model[name] != default for name, default in MODEL_DEFAULTS)
+        return structure, distance
+
+
+def initialCase(window):
+    """!
+    @brief Get the case of the GUI at startup: the catalog files, the example hierarchy and all filters checked.
+    @param window The reference window, in its initial state.
+    @return The case.
+    """
+    hierarchy = window.currentHierarchy()
+    return Case(copy.deepcopy(window.features), copy.deepcopy(window.analyzability), copy.deepcopy(window.dataflow_models),
+                hierarchy.category_1, hierarchy.category_2, hierarchy.coefficient_1, hierarchy.coefficient_2, window.getFilterState())
+
+
+def randomCase(rng, feature_labels, analyzability_labels, reference):
+    """!
+    @brief Generate a random case.
+    @param rng The random generator.
+    @param feature_labels The labels of the features checkboxes of the filter box.
+    @param analyzability_labels The labels of the static analyses checkboxes of the filter box.
+    @param reference A case whose features and static analyses are sampled to build the vocabulary.
+    @return The case.
+    """
+    def sample(population, k):
+        return rng.sample(population, min(k, len(population)))
+
+    features = dict(sample(sorted(reference.features.items()), rng.randint(len(reference.features) // 2, len(reference.features))))
+    analyzability = dict(sample(sorted(reference.analyzability.items()), rng.randint(len(reference.analyzability) // 2, len(reference.analyzability))))
+    for i in range(rng.randint(0, 2)):
+        features['x' + str(i)] = 'Extra feature ' + str(i)
+    dataflow_models = {}
+    for i in range(rng.randint(0, MAX_MODELS)):
+        model_features = sample(list(features) + UNKNOWN_ABBREVIATIONS, rng.randint(0, len(features) + 1))
+        dataflow_models['m' + str(i)] = {
+            'name': 'Model ' + str(i),
+            # A feature may be listed twice.
+            'features': model_features + sample(model_features, rng.randint(0, 1)),
+            'analyzability': sample(list(analyzability) + UNKNOWN_ABBREVIATIONS, rng.randint(0, len(analyzability) + 1)),
+            'range_rate': rng.choice(RANGE_RATES),
+            'rate_updates': [rng.choice(UPDATES) for _ in range(rng.choice((1, 1, 2, 2, 3)))],
+            'topology_updates': [rng.choice(UPDATES) for _ in range(rng.choice((1, 1, 2, 2, 3)))],
+            'turing_complete': rng.choice((True, False, None))
+        }
+    labels = list(features.values()) + [DOMAIN_RATE, RATE_TOPOLOGY_DYNAMISM] + list(analyzability.values())
+    labels += [rng.choice(labels + [DOMAIN_RATE]) for _ in range(rng.randint(0, 2))] + sample(UNKNOWN_LABELS, rng.randint(0, 2))
+    rng.shuffle(labels)
+    category_1 = []
+    category_2 = []
+    for label in labels:
+        choice = rng.random()
+        if choice < 0.45:
+            category_1.append(label)
+        elif choice < 0.9:
+            category_2.append(label)
+    all_features = rng.random() < 0.3
+    all_analyzability = rng.random() < 0.3
+    # Few items are checked with the All radio buttons and most items with the Any radio buttons, otherwise almost no model is displayed.
+    filters = {
+        'features': sample(feature_labels, rng.randint(0, 3) if all_features else rng.randint(len(feature_labels) // 2, len(feature_labels))),
+        'all_features': all_features,
+        'analyzability': sample(analyzability_labels, rng.randint(0, 3) if all_analyzability else rng.randint(len(analyzability_labels) // 2, len(analyzability_labels))),
+        'all_analyzability': all_analyzability,
+        'non_turing_complete': rng.random() < 0.8,
+        'turing_complete': rng.random() < 0.8,
+        'meta_models': rng.random() < 0.8
+    }
+    return Case(features, analyzability, dataflow_models, category_1, category_2, rng.randint(0, 3), rng.randint(0, 3), filters)
+
+
+def shrinkCandidates(case):
+    """!
+    @brief Generate the cases which are one simplification away from a case.
+    @param case The case.
+    @return An iterator over the simpler cases.
+    """
+    def variant(**changes):
+        result = copy.deepcopy(case)
+        for name, value in changes.items():
+            setattr(result, name, value)
+        return result
+
+    keys = list(case.dataflow_models)
+    if len(keys) > 1:
+        for key in keys:
+            yield variant(dataflow_models={key: case.dataflow_models[key]})
+    for key in keys:
+        yield variant(dataflow_models={k: v for k, v in case.dataflow_models.items() if k != key})
+    for name in ('features', 'analyzability'):
+        for key in getattr(case, name):
+            yield variant(**{name: {k: v for k, v in getattr(case, name).items() if k != key}})
+    for name in ('category_1', 'category_2'):
+        items = getattr(case, name)
+        for i in range(len(items)):
+            yield variant(**{name: items[:i] + items[i + 1:]})
+    for name in ('coefficient_1', 'coefficient_2'):
+        if getattr(case, name) > 1:
+            yield variant(**{name: 1})
+    for name in ('features', 'analyzability'):
+        for i in range(len(case.filters[name])):
+            yield variant(filters=dict(case.filters, **{name: case.filters[name][:i] + case.filters[name][i + 1:]}))
+    for name, default in FILTER_DEFAULTS:
+        if case.filters[name] != default:
+            yield variant(filters=dict(case.filters, **{name: default}))
+    for key, model in case.dataflow_models.items():
+        def modelVariant(**changes):
+            return variant(dataflow_models=dict(case.dataflow_models, **{key: dict(model, **changes)}))
+        for name in ('features', 'analyzability', 'rate_updates', 'topology_updates'):
+            for i in range(len(model[name])):
+                if name in ('features', 'analyzability') or len(model[name]) > 1:
+                    yield modelVariant(**{name: model[name][:i] + model[name][i + 1:]})
+        for name, default in MODEL_DEFAULTS:
+            if model[name] != default:
+                yield modelVariant(**{name: default})
+
+
+def shrink(case, fails):
+    """!
+    @brief Shrink a failing case to a minimal failing case, i.e. a case whose simplifications all pass.
+    @param case The failing case.
+    @param fails A function telling if a case fails.
+    @return The minimal failing case.
+    """
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for candidate in shrinkCandidates(case):
+            if candidate.size() < case.size() and fails(candidate):
+                case = candidate
+                shrunk = True
+                break
+    return case
+
+
+def configureWindow(window, case):
+    """!
+    @brief Display a case in a window of the GUI, without updating its table and graph.
+    @param window The window.
+    @param case The case.
+    """
+    window.features = case.features
+    window.analyzability = case.analyzability
+    window.dataflow_models = case.dataflow_models
+    window.category_1_list.clear()
+    window.category_2_list.clear()
+    for label in case.category_1:
+        window.category_1_list.addItem(label)
+    for label in case.category_2:
+        window.category_2_list.addItem(label)
+    for spin_box, coefficient in ((window.coefficient_category_1_spin_box, case.coefficient_1), (window.coefficient_category_2_spin_box, case.coefficient_2)):
+        spin_box.blockSignals(True)
+        spin_box.setValue(coefficient)
+        spin_box.blockSignals(False)
+    window.setFilterState(case.filters)
+
+
+class ReferenceEngine:
+    """!
+    @brief This class runs the reference implementation of the GUI, and its current implementation, on a hidden window.
+    """
+
+    def __init__(self):
+        """!
+        @brief Create the hidden window. It must be created from the directory containing `resources`.
+        """
+        # The GUI module is imported here so that engines given as module:function do not need Qt.
+        from classificationGUI import classificationGUI
+        self.application = QApplication.instance() or QApplication([])
+        self.window = classificationGUI()
+        self.feature_labels = [child.text() for child in self.window.features_frame.findChildren(QCheckBox)]
+        self.analyzability_labels = [child.text() for child in self.window.analyzability_frame.findChildren(QCheckBox)]
+
+    def __call__(self, case):
+        """!
+        @brief Score and filter a case with the per-model reference implementation.
+        @param case The case.
+        @return The keys of the displayed models mapped to their (expressiveness, analyzability) scores.
+        """
+        configureWindow(self.window, case)
+        models = self.window.getModelsToPrintReference()
+        return {m: (e, a) for m, e, a in zip(models, self.window.getExpressivenessScore(models), self.window.getAnalyzability(models))}
+
+    def gui(self, case):
+        """!
+        @brief Score and filter a case with the current implementation of the GUI (getModelsToPrint() and scoreModels()).
+        @param case The case.
+        @return The keys of the displayed models mapped to their (expressiveness, analyzability) scores.
+        """
+        configureWindow(self.window, case)
+        self.window.catalog = CompiledCatalog(case.features, case.analyzability, case.dataflow_models)
+        models = self.window.getModelsToPrint()
+        expressiveness, analyzability = self.window.scoreModels(models)
+        return {m: (e, a) for m, e, a in zip(models, expressiveness, analyzability)}
+
+
+def catalogEngine(case):
+    """!
+    @brief Score and filter a case with the compiled catalog only, without the GUI.
+    @param case The case.
+    @return The keys of the displayed models mapped to their (expressiveness, analyzability) scores.
+    """
+    catalog = CompiledCatalog(case.features, case.analyzability, case.dataflow_models)
+    features = [next((k for k, v in case.features.items() if v == label), None) for label in case.filters['features']]
+    analyzability = [next((k for k, v in case.analyzability.items() if v == label), None) for label in case.filters['analyzability']]
+    turing_classes = [c for c, shown in ((NON_TURING_COMPLETE, 'non_turing_complete'), (TURING_COMPLETE, 'turing_complete'), (META_MODEL, 'meta_models')) if case.filters[shown]]
+    mask = catalog.filterMask(features, case.filters['all_features'], analyzability, case.filters['all_analyzability'], turing_classes)
+    expressiveness, analyzability = catalog.score(*Hierarchy(case.category_1, case.category_2, case.coefficient_1, case.coefficient_2).weightVector(catalog.labels))
+    return {catalog.keys[i]: (float(expressiveness[i]), float(analyzability[i])) for i in np.flatnonzero(mask)}
+
+
+def differences(expected, actual):
+    """!
+    @brief Get the differences between the results of the reference and of an engine.
+    @param expected The results of the reference.
+    @param actual The results of the engine.
+    @return The list of differences, empty if the results are identical.
+    """
+    result = []
+    for model in sorted(set(expected) | set(actual)):
+        if model not in actual:
+            result.append(model + ': displayed by the reference only')
+        elif model not in expected:
+            result.append(model + ': displayed by the engine only')
+        elif tuple(expected[model]) != tuple(actual[model]):
+            result.append(model + ': (expressiveness, analyzability) is ' + str(tuple(actual[model])) + ' instead of ' + str(tuple(expected[model])))
+    return result
+
+
+def runHarness(engine, reference, cases, seed):
+    """!
+    @brief Check an engine against the reference on random cases.
+    @param engine The engine to check.
+    @param reference The reference engine.
+    @param cases The number of cases.
+    @param seed The seed of the random generator.
+    @return None if all cases pass, otherwise the minimal failing case and its differences.
+    """
+    def fails(case):
+        try:
+            return bool(differences(reference(case), engine(case)))
+        except Exception:
+            return True
+
+    rng = random.Random(seed)
+    initial = initialCase(reference.window)
+    for i in range(cases):
+        case = initial if i == 0 else randomCase(rng, reference.feature_labels, reference.analyzability_labels, initial)
+        if fails(case):
+            case = shrink(case, fails)
+            try:
+                return case, differences(reference(case), engine(case))
+            except Exception as e:
+                return case, ['the engine raised ' + repr(e)]
+    return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check a scoring and filtering engine against the reference implementation of the GUI')
+    parser.add_argument('--engine', type=str, default='gui', help="Engine to check: 'gui' (current GUI), 'catalog' (compiled catalog only) or module:function")
+    parser.add_argument('--cases', type=int, default=300, help='Number of random cases')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the random generator')
+    parser.add_argument('-o', '--output', type=str, default=None, help='JSON file receiving the minimal failing case')
+    args = parser.parse_args()
+    reference = ReferenceEngine()
+    if args.engine == 'gui':
+        engine = reference.gui
+    elif args.engine == 'catalog':
+        engine = catalogEngine
+    else:
+        module, _, function = args.engine.partition(':')
+        engine = getattr(importlib.import_module(module), function)
+    failure = runHarness(engine, reference, args.cases, args.seed)
+    if failure is None:
+        print(str(args.cases) + " cases passed", file=sys.stderr)
+        sys.exit(0)
+    case, problems = failure
+    print("Minimal failing case:", file=sys.stderr)
+    print(json.dumps(case.toJSON(), indent=4))
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(case.toJSON(), f, indent=4)
+    sys.exit(1)
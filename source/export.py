@@ -0,0 +1,214 @@
+"""!
+@file export.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the streaming export of the scored dataflow models to CSV, JSON Lines or Parquet files.
+
+Rows are built and written chunk after chunk, so that exporting millions of models never holds the whole table in memory. The Parquet format requires the optional `pyarrow` package.
+"""
+
+import os
+import csv
+import json
+import importlib.util
+
+import numpy as np
+
+from catalogdiff import formatValue
+from comparison import rankDescending
+
+## Number of rows built and written at once.
+CHUNK_SIZE = 65536
+## Columns of the exported files.
+COLUMNS = ['rank', 'key', 'name', 'expressiveness', 'analyzability', 'turing_complete', 'range_rate', 'rate_updates', 'topology_updates', 'features', 'static_analyses']
+## Exported formats, with the extension of their files.
+FORMATS = {'csv': '.csv', 'jsonl': '.jsonl', 'parquet': '.parquet'}
+
+
+def availableFormats():
+    """!
+    @brief Get the formats which can be exported with the installed packages.
+    @return The list of formats.
+    """
+    return [f for f in FORMATS if f != 'parquet' or importlib.util.find_spec('pyarrow') is not None]
+
+
+class ResultsExport:
+    """!
+    @brief This class exports the scores and attributes of some dataflow models, ranked by the sum of their expressiveness and analyzability scores.
+    """
+
+    def __init__(self, catalog, dataflow_models, positions, expressiveness, analyzability, chunk_size=CHUNK_SIZE):
+        """!
+        @brief Prepare an export.
+        @param catalog The compiled catalog.
+        @param dataflow_models The descriptions of the dataflow models (key to description).
+        @param positions The positions in the catalog of the exported models.
+        @param expressiveness The expressiveness scores of all the models of the catalog.
+        @param analyzability The analyzability scores of all the models of the catalog.
+        @param chunk_size The number of rows built and written at once.
+        """
+        expressiveness = expressiveness[positions]
+        analyzability = analyzability[positions]
+        total = expressiveness + analyzability
+        order = np.argsort(-total, kind='stable')
+        self.keys = catalog.keys
+        self.names = catalog.names
+        self.dataflow_models = dataflow_models
+        self.positions = positions[order]
+        self.expressiveness = expressiveness[order]
+        self.analyzability = analyzability[order]
+        # Tied models share the best of their ranks.
+        self.ranks = rankDescending(total[order, np.newaxis])[:, 0]
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return len(self.positions)
+
+    def chunks(self):
+        """!
+        @brief Build the rows chunk after chunk.
+        @return An iterator over the chunks, each chunk maps the columns to the lists of their values.
+        """
+        for start in range(0, len(self), self.chunk_size):
+            stop = start + self.chunk_size
+            keys = [self.keys[p] for p in self.positions[start:stop].tolist()]
+            descriptions = [self.dataflow_models[k] for k in keys]
+            yield {
+                'rank': self.ranks[start:stop].tolist(),
+                'key': keys,
+                'name': [self.names[p] for p in self.positions[start:stop].tolist()],
+                'expressiveness': self.expressiveness[start:stop].tolist(),
+                'analyzability': self.analyzability[start:stop].tolist(),
+                'turing_complete': [d['turing_complete'] for d in descriptions],
+                'range_rate': [d['range_rate'] for d in descriptions],
+                'rate_updates': [d['rate_updates'] for d in descriptions],
+                'topology_updates': [d['topology_updates'] for d in descriptions],
+                'features': [d['features'] for d in descriptions],
+                'static_analyses': [d['analyzability'] for d in descriptions]
+            }
+
+    def write(self, path, format, progress=None):
+        """!
+        @brief Write the rows to a file. A cancelled export removes the partially written file.
+        @param path The path of the file.
+        @param format The format of the file: 'csv', 'jsonl' or 'parquet'.
+        @param progress A function called after each chunk with the number of written rows and the total number of rows, which returns False to cancel the export.
+        @return True if all rows were written, False if the export was cancelled.
+        @throw ValueError If the format is unknown.
+        @throw ImportError If the format is 'parquet' and pyarrow is not installed.
+        """
+        if format == 'csv':
+            writer = CSVWriter(path)
+        elif format == 'jsonl':
+            writer = JSONLinesWriter(path)
+        elif format == 'parquet':
+            writer = ParquetWriter(path)
+        else:
+            raise ValueError('Unknown export format: ' + str(format))
+        written = 0
+        completed = True
+        try:
+            for chunk in self.chunks():
+                writer.writeChunk(chunk)
+                written += len(chunk['key'])
+                if progress is not None and not progress(written, len(self)):
+                    completed = False
+                    break
+        finally:
+            writer.close()
+        if not completed:
+            os.remove(path)
+        return completed
+
+
+class CSVWriter:
+    """!
+    @brief This class writes chunks of rows to a CSV file, lists of values are separated by spaces.
+    """
+
+    def __init__(self, path):
+        """!
+        @brief Open a CSV file and write its header.
+        @param path The path of the file.
+        """
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(COLUMNS)
+
+    def writeChunk(self, chunk):
+        """!
+        @brief Write a chunk of rows.
+        @param chunk The chunk, mapping the columns to the lists of their values.
+        """
+        for row in zip(*(chunk[c] for c in COLUMNS)):
+            self.writer.writerow([formatValue(v) if isinstance(v, float) else ' '.join(v) if isinstance(v, list) else v for v in row])
+
+    def close(self):
+        """!
+        @brief Close the file.
+        """
+        self.file.close()
+
+
+class JSONLinesWriter:
+    """!
+    @brief This class writes chunks of rows to a JSON Lines file, one JSON object per model.
+    """
+
+    def __init__(self, path):
+        """!
+        @brief Open a JSON Lines file.
+        @param path The path of the file.
+        """
+        self.file = open(path, 'w')
+
+    def writeChunk(self, chunk):
+        """!
+        @brief Write a chunk of rows.
+        @param chunk The chunk, mapping the columns to the lists of their values.
+        """
+        self.file.write(''.join(json.dumps(dict(zip(COLUMNS, row))) + '\n' for row in zip(*(chunk[c] for c in COLUMNS))))
+
+    def close(self):
+        """!
+        @brief Close the file.
+        """
+        self.file.close()
+
+
+class ParquetWriter:
+    """!
+    @brief This class writes chunks of rows to a Parquet file, one row group per chunk.
+    """
+
+    def __init__(self, path):
+        """!
+        @brief Open a Parquet file.
+        @param path The path of the file.
+        @throw ImportError If pyarrow is not installed.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        self.schema = pa.schema([
+            ('rank', pa.int64()), ('key', pa.string()), ('name', pa.string()),
+            ('expressiveness', pa.float64()), ('analyzability', pa.float64()), ('turing_complete', pa.bool_()),
+            ('range_rate', pa.string()), ('rate_updates', pa.list_(pa.string())), ('topology_updates', pa.list_(pa.string())),
+            ('features', pa.list_(pa.string())), ('static_analyses', pa.list_(pa.string()))
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def writeChunk(self, chunk):
+        """!
+        @brief Write a chunk of rows.
+        @param chunk The chunk, mapping the columns to the lists of their values.
+        """
+        self.writer.write_table(self.pa.table(chunk, schema=self.schema))
+
+    def close(self):
+        """!
+        @brief Close the file.
+        """
+        self.writer.close()
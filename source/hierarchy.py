@@ -0,0 +1,133 @@
+"""!
+@file hierarchy.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the hierarchy used to weight the features, the dynamism and the static analyses of the dataflow models.
+"""
+
+import json
+
+import numpy as np
+
+from catalog import DOMAIN_RATE, RATE_TOPOLOGY_DYNAMISM
+
+
+class Hierarchy:
+    """!
+    @brief This class implements a hierarchy of items (features, domain rate, rate and topology dynamism, static analyses).
+
+    Items of category 1 are weighted by the coefficient of category 1, all other items are weighted by the coefficient of category 2. An item listed in `weights` is weighted by its own weight instead, whatever its category.
+    A hierarchy is stored in a JSON file with the following structure:
+    ```json
+    {
+        "category_1": {"coefficient": Number, "features": list of String},
+        "category_2": {"coefficient": Number, "features": list of String},
+        "weights": {String: Number}
+    }
+    ```
+    where `weights` is optional. A file containing only `weights` is also valid: items that are not weighted then score 0.
+    """
+
+    def __init__(self, category_1, category_2, coefficient_1, coefficient_2, weights=None):
+        """!
+        @brief Create a hierarchy.
+        @param category_1 The items of category 1.
+        @param category_2 The items of category 2.
+        @param coefficient_1 The coefficient of category 1.
+        @param coefficient_2 The coefficient of category 2.
+        @param weights The weight of individual items, overriding the coefficient of their category.
+        """
+        self.category_1 = list(category_1)
+        self.category_2 = list(category_2)
+        self.coefficient_1 = coefficient_1
+        self.coefficient_2 = coefficient_2
+        self.weights = dict(weights or {})
+
+    @classmethod
+    def fromJSON(cls, data, labels=()):
+        """!
+        @brief Create a hierarchy from the content of a JSON file.
+        @param data The content of the JSON file.
+        @param labels The items put in category 1 when the file only contains weights.
+        @return The hierarchy.
+        @throw ValueError If the content is not a valid hierarchy.
+        """
+        if not isinstance(data, dict):
+            raise ValueError('The hierarchy must be a JSON object.')
+        weights = data.get('weights', {})
+        if not isinstance(weights, dict) or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in weights.values()):
+            raise ValueError('The weights of the hierarchy must map items to numbers.')
+        if 'category_1' in data and 'category_2' in data:
+            try:
+                coefficients = (data['category_1']['coefficient'], data['category_2']['coefficient'])
+                hierarchy = cls(data['category_1']['features'], data['category_2']['features'], *coefficients, weights)
+            except (KeyError, TypeError) as e:
+                raise ValueError('The categories of the hierarchy are not valid.') from e
+            if not all(isinstance(c, (int, float)) and not isinstance(c, bool) for c in coefficients):
+                raise ValueError('The coefficients of the hierarchy must be numbers.')
+            return hierarchy
+        if 'weights' in data:
+            return cls(list(labels), [], 0, 0, weights)
+        raise ValueError('The hierarchy must contain two categories or weights.')
+
+    @classmethod
+    def load(cls, path, labels=()):
+        """!
+        @brief Load a hierarchy from a JSON file.
+        @param path The path of the JSON file.
+        @param labels The items put in category 1 when the file only contains weights.
+        @return The hierarchy.
+        @throw ValueError If the file is not a valid hierarchy.
+        """
+        with open(path) as f:
+            return cls.fromJSON(json.load(f), labels)
+
+    def toJSON(self):
+        """!
+        @brief Get the content of the JSON file of the hierarchy.
+        @return The content of the JSON file.
+        """
+        data = {
+            'category_1': {
+                'coefficient': self.coefficient_1,
+                'features': self.category_1
+            },
+            'category_2': {
+                'coefficient': self.coefficient_2,
+                'features': self.category_2
+            }
+        }
+        if self.weights:
+            data['weights'] = self.weights
+        return data
+
+    def weightOf(self, label):
+        """!
+        @brief Get the weight of an item.
+        @param label The item.
+        @return The weight of the item.
+        """
+        if label in self.weights:
+            return self.weights[label]
+        return self.coefficient_1 if label in self.category_1 else self.coefficient_2
+
+    def weightVector(self, labels):
+        """!
+        @brief Get the weight vector of the hierarchy over the items of a compiled catalog.
+        @param labels The items of the compiled catalog.
+        @return The weight vector and the offset of the expressiveness score.
+        @note The domain rate and the rate and topology dynamism items that are not in category 1 (and have no weight of their own) add the coefficient of category 2 to the expressiveness score instead of being weighted, as in the original two-category hierarchy.
+        """
+        category_1 = set(self.category_1)
+        vector = np.empty(len(labels))
+        offset = 0.0
+        for i, label in enumerate(labels):
+            if label in (DOMAIN_RATE, RATE_TOPOLOGY_DYNAMISM) and label not in self.weights and label not in category_1:
+                vector[i] = 0.0
+                offset += self.coefficient_2
+            elif label in self.weights:
+                vector[i] = self.weights[label]
+            else:
+                vector[i] = self.coefficient_1 if label in category_1 else self.coefficient_2
+        return vector, offset
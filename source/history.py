@@ -0,0 +1,191 @@
+"""!
+@file history.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the undo/redo history of the hierarchy and filters of the GUI.
+
+States are immutable snapshots made of tuples. A new snapshot reuses the parts of the previous one which did not change (e.g. the filters when only the hierarchy changed, or the list of category 2 when an item is moved to category 1), so that a long history only stores what changed between consecutive states. The scores of the most recent states are kept with them, so that going back or forward displays a state without scoring the catalog again.
+"""
+
+import sys
+from collections import OrderedDict
+
+from hierarchy import Hierarchy
+
+## Maximum number of states kept by the history.
+HISTORY_SIZE = 200
+## Maximum number of distinct weightings of the history whose scores are kept.
+SCORED_STATES = 16
+
+
+def share(value, previous):
+    """!
+    @brief Reuse the parts of a previous immutable value which are equal to the parts of a new one.
+    @param value The new value, made of tuples.
+    @param previous The previous value, made of tuples.
+    @return A value equal to `value`, sharing the equal parts of `previous`.
+    """
+    if value == previous:
+        return previous
+    if isinstance(value, tuple) and isinstance(previous, tuple) and len(value) == len(previous):
+        return tuple(share(v, p) for v, p in zip(value, previous))
+    return value
+
+
+def freezeHierarchy(hierarchy):
+    """!
+    @brief Get the immutable snapshot of a hierarchy.
+    @param hierarchy The hierarchy.
+    @return A tuple (category 1, category 2, coefficient 1, coefficient 2, weights).
+    """
+    return (tuple(sys.intern(label) for label in hierarchy.category_1), tuple(sys.intern(label) for label in hierarchy.category_2),
+            hierarchy.coefficient_1, hierarchy.coefficient_2, tuple(sorted(hierarchy.weights.items())))
+
+
+def thawHierarchy(snapshot):
+    """!
+    @brief Get the hierarchy of an immutable snapshot.
+    @param snapshot The snapshot made by freezeHierarchy().
+    @return The hierarchy.
+    """
+    category_1, category_2, coefficient_1, coefficient_2, weights = snapshot
+    return Hierarchy(list(category_1), list(category_2), coefficient_1, coefficient_2, dict(weights))
+
+
+def freezeFilters(filters):
+    """!
+    @brief Get the immutable snapshot of the state of the filters.
+    @param filters The state of the filters (cf. classificationGUI.getFilterState()).
+    @return A tuple of (name, value) pairs, lists are converted to tuples.
+    """
+    return tuple(sorted((name, tuple(sys.intern(v) for v in value) if isinstance(value, list) else value) for name, value in filters.items()))
+
+
+def thawFilters(snapshot):
+    """!
+    @brief Get the state of the filters of an immutable snapshot.
+    @param snapshot The snapshot made by freezeFilters().
+    @return The state of the filters.
+    """
+    return {name: list(value) if isinstance(value, tuple) else value for name, value in snapshot}
+
+
+class HistoryState:
+    """!
+    @brief This class describes a state of the history.
+    """
+
+    __slots__ = ('hierarchy', 'filters', 'score_key')
+
+    def __init__(self, hierarchy, filters, score_key):
+        """!
+        @brief Create a state.
+        @param hierarchy The snapshot of the hierarchy.
+        @param filters The snapshot of the filters.
+        @param score_key The key of the scores of the hierarchy (cf. CompiledCatalog.scoreKey()).
+        """
+        self.hierarchy = hierarchy
+        self.filters = filters
+        self.score_key = score_key
+
+
+class History:
+    """!
+    @brief This class implements the undo/redo history, with a bounded number of states and of stored scores.
+    """
+
+    def __init__(self, size=HISTORY_SIZE, scored_states=SCORED_STATES):
+        """!
+        @brief Create an empty history.
+        @param size The maximum number of states, the oldest states are forgotten.
+        @param scored_states The maximum number of distinct weightings whose scores are kept, the least recently used are forgotten.
+        """
+        self.size = size
+        self.scored_states = scored_states
+        self.states = []
+        self.position = -1
+        self.scores = OrderedDict()
+
+    def record(self, hierarchy, filters, score_key, scores):
+        """!
+        @brief Record the current state, unless it is the state at the current position. The states after the current position are forgotten.
+        @param hierarchy The current hierarchy.
+        @param filters The current state of the filters.
+        @param score_key The key of the scores of the hierarchy.
+        @param scores The expressiveness and analyzability scores of all the models for the hierarchy.
+        @return True if a new state was recorded, False otherwise.
+        """
+        self.keepScores(score_key, scores)
+        frozen_hierarchy = freezeHierarchy(hierarchy)
+        frozen_filters = freezeFilters(filters)
+        if self.position >= 0:
+            current = self.states[self.position]
+            if current.hierarchy == frozen_hierarchy and current.filters == frozen_filters:
+                return False
+            frozen_hierarchy = share(frozen_hierarchy, current.hierarchy)
+            frozen_filters = share(frozen_filters, current.filters)
+        del self.states[self.position + 1:]
+        self.states.append(HistoryState(frozen_hierarchy, frozen_filters, score_key))
+        if len(self.states) > self.size:
+            del self.states[0]
+        self.position = len(self.states) - 1
+        return True
+
+    def keepScores(self, score_key, scores):
+        """!
+        @brief Keep the scores of a weighting.
+        @param score_key The key of the scores.
+        @param scores The expressiveness and analyzability scores of all the models.
+        """
+        self.scores[score_key] = scores
+        self.scores.move_to_end(score_key)
+        if len(self.scores) > self.scored_states:
+            self.scores.popitem(last=False)
+
+    def discardScores(self):
+        """!
+        @brief Forget all the stored scores, e.g. when the catalog changed.
+        """
+        self.scores.clear()
+
+    def canUndo(self):
+        """!
+        @brief Check if there is a state before the current one.
+        @return True if undo() can be called, False otherwise.
+        """
+        return self.position > 0
+
+    def canRedo(self):
+        """!
+        @brief Check if there is a state after the current one.
+        @return True if redo() can be called, False otherwise.
+        """
+        return self.position < len(self.states) - 1
+
+    def undo(self):
+        """!
+        @brief Go back to the previous state.
+        @return The hierarchy, the state of the filters and the stored scores (None if they were forgotten) of the previous state.
+        """
+        self.position -= 1
+        return self.current()
+
+    def redo(self):
+        """!
+        @brief Go forward to the next state.
+        @return The hierarchy, the state of the filters and the stored scores (None if they were forgotten) of the next state.
+        """
+        self.position += 1
+        return self.current()
+
+    def current(self):
+        """!
+        @brief Get the state at the current position.
+        @return The hierarchy, the state of the filters and the stored scores (None if they were forgotten) of the state.
+        """
+        state = self.states[self.position]
+        scores = self.scores.get(state.score_key)
+        if scores is not None:
+            self.scores.move_to_end(state.score_key)
+        return thawHierarchy(state.hierarchy), thawFilters(state.filters), scores
@@ -0,0 +1,286 @@
+"""!
+@file ingestion.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the streaming loader which compiles several classification files into a single catalog.
+
+Two formats are read record after record, without loading a whole file in memory:
+- JSON files with the structure of `resources/classification.json` (one object mapping each model key to its description),
+- JSON Lines files (extension `.jsonl` or `.ndjson`) where each line is the description of a model with an additional `key` field.
+
+Usage:
+```bash
+python3 source/ingestion.py resources/classification.json in-house-variants.jsonl -o catalog.npz
+```
+"""
+
+import sys
+import json
+import argparse
+
+from catalog import CompiledCatalog, checkModel, RATE_RANGE_LEVELS, UPDATE_LEVELS
+
+## Number of characters read at once from a JSON file.
+READ_SIZE = 65536
+## Number of records compiled at once.
+BATCH_SIZE = 4096
+
+
+class IngestionIssue:
+    """!
+    @brief This class describes a problem found in a record.
+    """
+
+    def __init__(self, source, key, message, rejected):
+        """!
+        @brief Create an issue.
+        @param source The file containing the record.
+        @param key The key of the record (or the line number for unreadable lines).
+        @param message The description of the problem.
+        @param rejected True if the record was not compiled, False otherwise.
+        """
+        self.source = source
+        self.key = key
+        self.message = message
+        self.rejected = rejected
+
+    def __str__(self):
+        return self.source + ': ' + str(self.key) + ': ' + self.message + (' (rejected)' if self.rejected else '')
+
+
+def iterJSONLines(f):
+    """!
+    @brief Read the records of a JSON Lines file.
+    @param f The file to read.
+    @return An iterator over (key, description) pairs, the description is None with an error message as key for unreadable lines.
+    """
+    for number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            key = record.pop('key')
+        except (ValueError, KeyError, AttributeError, TypeError):
+            key = None
+        # Like the keys of a JSON object, the keys of the records are strings.
+        if not isinstance(key, str):
+            yield 'line ' + str(number), None
+            continue
+        yield key, record
+
+
+def iterJSONObject(f):
+    """!
+    @brief Read the entries of a JSON object one after the other, holding at most one entry in memory.
+    @param f The file to read.
+    @return An iterator over (key, description) pairs.
+    @throw ValueError If the file is not a JSON object.
+    """
+    decoder = json.JSONDecoder()
+    state = {'buffer': '', 'position': 0, 'eof': False}
+
+    def fill():
+        chunk = f.read(READ_SIZE)
+        state['buffer'] = state['buffer'][state['position']:] + chunk
+        state['position'] = 0
+        state['eof'] = not chunk
+        return bool(chunk)
+
+    def peek():
+        while True:
+            buffer = state['buffer']
+            while state['position'] < len(buffer) and buffer[state['position']].isspace():
+                state['position'] += 1
+            if state['position'] < len(buffer):
+                return buffer[state['position']]
+            if not fill():
+                raise ValueError('Unexpected end of file.')
+
+    def expect(characters):
+        character = peek()
+        if character not in characters:
+            raise ValueError('Expected ' + ' or '.join(repr(c) for c in characters) + ' but found ' + repr(character) + '.')
+        state['position'] += 1
+        return character
+
+    def decode():
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(state['buffer'], state['position'])
+                # A value ending the buffer may be truncated.
+                if end < len(state['buffer']) or state['eof']:
+                    state['position'] = end
+                    return value
+            except json.JSONDecodeError:
+                if state['eof']:
+                    raise
+            fill()
+
+    expect('{')
+    if peek() == '}':
+        return
+    while True:
+        key = decode()
+        if not isinstance(key, str):
+            raise ValueError('The keys of the classification must be strings.')
+        expect(':')
+        yield key, decode()
+        if expect(',}') == '}':
+            return
+
+
+def iterRecords(path):
+    """!
+    @brief Read the records of a classification file, in JSON or JSON Lines format depending on its extension.
+    @param path The path of the file.
+    @return An iterator over (key, description) pairs.
+    """
+    with open(path) as f:
+        if path.endswith('.jsonl') or path.endswith('.ndjson'):
+            yield from iterJSONLines(f)
+        else:
+            yield from iterJSONObject(f)
+
+
+def checkVocabulary(model, features, analyzability):
+    """!
+    @brief Check that a dataflow model only uses the features, static analyses, rate ranges and update policies known by the GUI.
+    @param model The description of the dataflow model (with a valid structure, cf. checkModel()).
+    @param features The features (abbreviation to name).
+    @param analyzability The static analyses (abbreviation to name).
+    @return The list of problems, empty if the model is valid. Unknown items are ignored by the scores.
+    """
+    problems = []
+    for feature in model['features']:
+        if feature not in features:
+            problems.append('unknown feature ' + repr(feature))
+    for analysis in model['analyzability']:
+        if analysis not in analyzability:
+            problems.append('unknown static analysis ' + repr(analysis))
+    if model['range_rate'] not in RATE_RANGE_LEVELS:
+        problems.append('unknown range rate ' + repr(model['range_rate']))
+    for update in model['rate_updates'] + model['topology_updates']:
+        if update not in UPDATE_LEVELS:
+            problems.append('unknown update policy ' + repr(update))
+    if model['turing_complete'] not in (True, False, None):
+        problems.append('invalid Turing completeness ' + repr(model['turing_complete']))
+    return problems
+
+
+class CatalogBuilder:
+    """!
+    @brief This class compiles records coming from several sources into a single catalog, batch after batch.
+
+    Conflicting keys are resolved deterministically according to the order of the records: the last record of a key wins with the 'last' policy (e.g. in-house variants overriding the survey base when given after it), the first one with the 'first' policy.
+    """
+
+    def __init__(self, features, analyzability, conflicts='last', strict=False, batch_size=BATCH_SIZE):
+        """!
+        @brief Create an empty catalog builder.
+        @param features The features (abbreviation to name).
+        @param analyzability The static analyses (abbreviation to name).
+        @param conflicts The conflict resolution policy: 'last' or 'first'.
+        @param strict True to reject the models using unknown features, static analyses, rate ranges or update policies.
+        @param batch_size The number of records compiled at once.
+        """
+        if conflicts not in ('last', 'first'):
+            raise ValueError('Unknown conflict resolution policy: ' + str(conflicts))
+        self.catalog = CompiledCatalog(features, analyzability, {})
+        self.conflicts = conflicts
+        self.strict = strict
+        self.batch_size = batch_size
+        self.batch = []
+        self.issues = []
+        self.overridden = 0
+
+    def addSource(self, path):
+        """!
+        @brief Compile all the records of a classification file.
+        @param path The path of the file.
+        """
+        for key, model in iterRecords(path):
+            if model is None:
+                self.issues.append(IngestionIssue(path, key, 'unreadable record', True))
+                continue
+            try:
+                checkModel(model)
+            except ValueError as e:
+                self.issues.append(IngestionIssue(path, key, str(e), True))
+                continue
+            problems = checkVocabulary(model, self.catalog.features, self.catalog.analyzability)
+            if problems:
+                self.issues.append(IngestionIssue(path, key, ', '.join(problems), self.strict))
+                if self.strict:
+                    continue
+            self.batch.append((key, model))
+            if len(self.batch) >= self.batch_size:
+                self.flush()
+        self.flush()
+
+    def flush(self):
+        """!
+        @brief Compile the pending batch of records into the catalog.
+        """
+        catalog = self.catalog
+        for key, model in self.batch:
+            if key in catalog.index:
+                self.overridden += 1
+                if self.conflicts == 'first':
+                    continue
+            else:
+                if len(catalog.keys) == len(catalog.names):
+                    catalog.resize(max(2 * len(catalog.keys), self.batch_size))
+                catalog.index[key] = len(catalog.keys)
+                catalog.keys.append(key)
+            catalog.setModel(catalog.index[key], model)
+        self.batch = []
+
+    def build(self):
+        """!
+        @brief Finish the compilation.
+        @return The compiled catalog.
+        """
+        self.flush()
+        self.catalog.resize(len(self.catalog.keys))
+        self.catalog.buildMatrix()
+        self.catalog.cache.clear()
+        return self.catalog
+
+
+def loadCatalog(paths, features, analyzability, conflicts='last', strict=False):
+    """!
+    @brief Compile several classification files into a single catalog.
+    @param paths The paths of the files, in order of precedence defined by `conflicts`.
+    @param features The features (abbreviation to name).
+    @param analyzability The static analyses (abbreviation to name).
+    @param conflicts The conflict resolution policy: 'last' or 'first'.
+    @param strict True to reject the models using unknown features, static analyses, rate ranges or update policies.
+    @return The compiled catalog and the list of issues.
+    """
+    builder = CatalogBuilder(features, analyzability, conflicts, strict)
+    for path in paths:
+        builder.addSource(path)
+    return builder.build(), builder.issues
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Compile several classification files into a single catalog')
+    parser.add_argument('sources', type=str, nargs='+', help='Classification files (JSON or JSON Lines)')
+    parser.add_argument('--features', type=str, default='resources/features.json', help='Features file')
+    parser.add_argument('--analyzability', type=str, default='resources/analyzability.json', help='Static analyses file')
+    parser.add_argument('--conflicts', type=str, default='last', choices=['last', 'first'], help='Record kept when several records share a key')
+    parser.add_argument('--strict', action='store_true', help='Reject the models using unknown features, static analyses, rate ranges or update policies')
+    parser.add_argument('-o', '--output', type=str, required=True, help='Compiled catalog (numpy archive)')
+    args = parser.parse_args()
+    with open(args.features) as f:
+        features = json.load(f)
+    with open(args.analyzability) as f:
+        analyzability = json.load(f)
+    catalog, issues = loadCatalog(args.sources, features, analyzability, args.conflicts, args.strict)
+    for issue in issues:
+        print(issue, file=sys.stderr)
+    catalog.save(args.output)
+    print(str(len(catalog)) + " models compiled, " + str(sum(issue.rejected for issue in issues)) + " rejected", file=sys.stderr)
@@ -0,0 +1,50 @@
+"""!
+@file neighbourhood.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the dominance and neighbourhood queries of a dataflow model among the other models of the catalog.
+"""
+
+import numpy as np
+
+
+def dominance(expressiveness, analyzability, position, candidates):
+    """!
+    @brief Get the models dominating a model and the models it dominates. A model dominates another one if none of its scores is lower and at least one of its scores is higher.
+    @param expressiveness The expressiveness scores of all the models of the catalog.
+    @param analyzability The analyzability scores of all the models of the catalog.
+    @param position The position of the model in the catalog.
+    @param candidates The positions of the models compared with the model.
+    @return The positions of the models dominating the model and the positions of the models it dominates, both sorted by decreasing total score.
+    """
+    e = expressiveness[position]
+    a = analyzability[position]
+    candidate_e = expressiveness[candidates]
+    candidate_a = analyzability[candidates]
+    dominating = candidates[(candidate_e >= e) & (candidate_a >= a) & ((candidate_e > e) | (candidate_a > a))]
+    dominated = candidates[(candidate_e <= e) & (candidate_a <= a) & ((candidate_e < e) | (candidate_a < a))]
+    total = expressiveness + analyzability
+    return dominating[np.argsort(-total[dominating], kind='stable')], dominated[np.argsort(-total[dominated], kind='stable')]
+
+
+def nearestNeighbours(catalog, position, candidates, k):
+    """!
+    @brief Get the k models closest to a model in the space of features and static analyses (Jaccard distance).
+    @param catalog The compiled catalog.
+    @param position The position of the model in the catalog.
+    @param candidates The positions of the models searched, the model itself is ignored.
+    @param k The number of neighbours.
+    @return The positions of the neighbours and their distances, sorted by increasing distance.
+    """
+    candidates = candidates[candidates != position]
+    distances = catalog.jaccardDistances(position, candidates)
+    if k <= 0:
+        return candidates[:0], distances[:0]
+    if k < len(candidates):
+        # Models as distant as the k-th one are kept so that ties are broken by position.
+        nearest = np.flatnonzero(distances <= np.partition(distances, k - 1)[k - 1])
+    else:
+        nearest = np.arange(len(candidates))
+    nearest = nearest[np.lexsort((candidates[nearest], distances[nearest]))][:k]
+    return candidates[nearest], distances[nearest]
@@ -0,0 +1,132 @@
+"""!
+@file optimizer.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the optimizer looking for the hierarchy which puts a chosen dataflow model on top of the ranking.
+"""
+
+import itertools
+
+import numpy as np
+
+from catalog import DOMAIN_RATE, RATE_TOPOLOGY_DYNAMISM, objectiveScore
+from hierarchy import Hierarchy
+
+## Tolerance used to compare scores.
+EPSILON = 1e-9
+## Highest coefficient tried by default, the maximum of the coefficients spin boxes of the GUI.
+MAX_COEFFICIENT = 3
+
+
+class OptimizationResult:
+    """!
+    @brief This class contains the result of the rank optimization.
+    """
+
+    def __init__(self, hierarchy, rank, margin, moved, changes):
+        """!
+        @brief Create an optimization result.
+        @param hierarchy The optimized hierarchy.
+        @param rank The rank of the target model with the optimized hierarchy (1 is the top), tied models share the best of their ranks as in comparison.rankDescending().
+        @param margin The score of the target model minus the best score of the other models.
+        @param moved The items moved from one category to the other.
+        @param changes The number of changes from the initial hierarchy (moved items and changed coefficients).
+        """
+        self.hierarchy = hierarchy
+        self.rank = rank
+        self.margin = margin
+        self.moved = moved
+        self.changes = changes
+
+
+def optimizeHierarchy(catalog, hierarchy, target, models, objective='total', coefficients=None):
+    """!
+    @brief Find the hierarchy which gives the best rank to a target model with the fewest changes from the current hierarchy.
+
+    The search is a branch-and-bound over the bipartition of the items in categories 1 and 2, repeated for each pair of coefficients. The solutions are ordered by rank of the target model (tied models share the best of their ranks), then by number of changes (moved items and changed coefficients), then by score margin over the other models. At each node, the optimistic score difference between the target model and every competing model is computed at once, which bounds both the rank and the margin reachable from the node. Items with a weight of their own are kept as is.
+    @param catalog The compiled catalog.
+    @param hierarchy The current hierarchy.
+    @param target The key of the model to put on top.
+    @param models The keys of the models competing with the target model.
+    @param objective The score ranking the models: 'expressiveness', 'analyzability' or 'total' (sum of both).
+    @param coefficients The candidate pairs of coefficients, by default all pairs of integers between 0 and MAX_COEFFICIENT.
+    @return An OptimizationResult.
+    """
+    # Only the rows of the target model and of its competitors are multiplied by the items.
+    positions = catalog.indicesOf([target] + [m for m in dict.fromkeys(models) if m != target])
+    columns = catalog.product(np.eye(len(catalog.labels)), np.stack([2 * positions, 2 * positions + 1], axis=1).ravel())
+    scores = objectiveScore(columns[0::2], columns[1::2], objective)
+    differences = scores[0] - scores[1:]
+    labels = catalog.labels
+    category_1 = set(hierarchy.category_1)
+    current = np.array([label in category_1 for label in labels])
+    fixed = np.array([label in hierarchy.weights for label in labels])
+    dynamism = np.array([label in (DOMAIN_RATE, RATE_TOPOLOGY_DYNAMISM) for label in labels])
+    base = differences[:, fixed] @ np.array([hierarchy.weights[label] for label in np.array(labels)[fixed]], dtype=np.float64)
+    if coefficients is None:
+        coefficients = list(itertools.product(range(MAX_COEFFICIENT + 1), repeat=2))
+    coefficients = sorted(set(coefficients) | {(hierarchy.coefficient_1, hierarchy.coefficient_2)}, key=lambda c: (c[0] != hierarchy.coefficient_1) + (c[1] != hierarchy.coefficient_2))
+    best = {'key': (np.inf,), 'assignment': current, 'coefficients': (hierarchy.coefficient_1, hierarchy.coefficient_2)}
+    for coefficient_1, coefficient_2 in coefficients:
+        coefficient_changes = (coefficient_1 != hierarchy.coefficient_1) + (coefficient_2 != hierarchy.coefficient_2)
+        in_category_1 = differences * coefficient_1
+        # Not weighted dynamism items add the same constant to all models in category 2.
+        in_category_2 = np.where(dynamism, 0.0, differences * coefficient_2)
+        searchBipartition(in_category_1, in_category_2, current, fixed, base, coefficient_changes, (coefficient_1, coefficient_2), best)
+    assignment = best['assignment']
+    moved = [label for label, a, c in zip(labels, assignment, current) if a != c]
+    new_category_1 = [label for label in hierarchy.category_1 if label not in moved] + [label for label in moved if label not in category_1]
+    new_category_2 = [label for label in hierarchy.category_2 if label not in moved] + [label for label in moved if label in category_1]
+    coefficient_1, coefficient_2 = best['coefficients']
+    rank, changes, negative_margin = best['key']
+    return OptimizationResult(Hierarchy(new_category_1, new_category_2, coefficient_1, coefficient_2, hierarchy.weights), rank, -negative_margin, moved, changes)
+
+
+def searchBipartition(in_category_1, in_category_2, current, fixed, base, changes, coefficients, best):
+    """!
+    @brief Branch-and-bound over the bipartition of the items for a pair of coefficients.
+    @param in_category_1 The score difference between the target model and each other model brought by each item in category 1, of shape (models, items).
+    @param in_category_2 The score difference brought by each item in category 2.
+    @param current The current assignment of the items (True for category 1).
+    @param fixed The items which are not moved.
+    @param base The score difference brought by the fixed items.
+    @param changes The number of changes before moving any item.
+    @param coefficients The pair of coefficients.
+    @param best The best solution found so far, updated in place.
+    """
+    assignment = current.copy()
+    partial = base.copy()
+    free = []
+    for i in range(len(current)):
+        kept, other = (in_category_1[:, i], in_category_2[:, i]) if current[i] else (in_category_2[:, i], in_category_1[:, i])
+        if fixed[i] or np.all(kept >= other):
+            # Moving this item cannot bring the target model closer to the top.
+            if not fixed[i]:
+                partial += kept
+        else:
+            free.append(i)
+    free.sort(key=lambda i: -np.abs(in_category_1[:, i] - in_category_2[:, i]).sum())
+    optimistic = np.zeros((len(free) + 1, len(base)))
+    for depth in range(len(free) - 1, -1, -1):
+        i = free[depth]
+        optimistic[depth] = optimistic[depth + 1] + np.maximum(in_category_1[:, i], in_category_2[:, i])
+
+    def explore(depth, partial, changes):
+        bound = partial + optimistic[depth]
+        # Only the models scoring strictly higher than the target model rank above it.
+        key = (1 + int(np.count_nonzero(bound < -EPSILON)), changes, -bound.min() if len(bound) else -np.inf)
+        if key >= best['key']:
+            return
+        if depth == len(free):
+            best['key'] = key
+            best['assignment'] = assignment.copy()
+            best['coefficients'] = coefficients
+            return
+        i = free[depth]
+        for move in (False, True):
+            assignment[i] = current[i] != move
+            explore(depth + 1, partial + (in_category_1[:, i] if assignment[i] else in_category_2[:, i]), changes + move)
+        assignment[i] = current[i]
+
+    explore(0, partial, changes)
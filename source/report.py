@@ -0,0 +1,226 @@
+"""!
+@file report.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the headless rendering of the graph and the ranked table of the dataflow models for a list of hierarchies.
+
+For each hierarchy, the graph of the GUI (cf. item 5 of the GUI description) is exported in PNG and/or SVG, and the table ranked by the sum of the expressiveness and analyzability scores is exported in CSV and/or HTML. Hierarchies are rendered by a pool of worker processes, each of them compiling the catalog and building the graph once for all the hierarchies it renders.
+
+Usage:
+```bash
+python3 source/report.py resources/hierarchy-example.json other-hierarchy.json -o report --formats png svg csv html --workers 4
+```
+"""
+
+import os
+import csv
+import html
+import json
+import argparse
+import multiprocessing
+
+import numpy as np
+
+from catalogdiff import formatValue
+from comparison import rankDescending
+from hierarchy import Hierarchy
+from ingestion import loadCatalog
+
+## Formats of the graph.
+PLOT_FORMATS = ('png', 'svg')
+## Formats of the table.
+TABLE_FORMATS = ('csv', 'html')
+## Size of the exported graph, in pixels.
+PLOT_SIZE = (800, 600)
+
+## State of a worker process: the renderer reused by all the hierarchies it renders.
+worker = {}
+
+
+class ReportRenderer:
+    """!
+    @brief This class renders the graph and the table of several hierarchies, reusing the same compiled catalog and graph.
+    """
+
+    def __init__(self, catalog, filters, formats):
+        """!
+        @brief Create a renderer.
+        @param catalog The compiled catalog.
+        @param filters The filters selecting the models, with the structure of the filters of the scoring service.
+        @param formats The formats to export.
+        """
+        self.catalog = catalog
+        self.positions = np.flatnonzero(catalog.filterMaskFromJSON(filters))
+        self.formats = formats
+        self.graph = None
+        if any(f in PLOT_FORMATS for f in formats):
+            self.buildGraph()
+
+    def buildGraph(self):
+        """!
+        @brief Build the graph once, configured as in the GUI.
+        """
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        import pyqtgraph as pg
+        import pyqtgraph.exporters
+        from PyQt5.QtWidgets import QApplication
+        self.application = QApplication.instance() or QApplication([])
+        self.graph = pg.PlotWidget()
+        self.graph.resize(*PLOT_SIZE)
+        self.graph.getAxis('left').setPen('k')
+        self.graph.getAxis('bottom').setPen('k')
+        self.graph.setBackground('w')
+        self.graph.setLabel('left', 'Analyzability')
+        self.graph.setLabel('bottom', 'Expressiveness')
+        self.points = self.graph.plot([], [], pen=None, symbol='+', symbolPen=None, symbolBrush='black')
+        # The graph is shown on the offscreen platform so that its layout is computed before the exports.
+        self.graph.show()
+        self.exporters = {'png': pyqtgraph.exporters.ImageExporter, 'svg': pyqtgraph.exporters.SVGExporter}
+
+    def render(self, path, output, name):
+        """!
+        @brief Render the graph and the table of a hierarchy.
+        @param path The path of the hierarchy file.
+        @param output The directory of the exported files.
+        @param name The name of the exported files, without extension, also used as title.
+        @return The paths of the exported files.
+        """
+        hierarchy = Hierarchy.load(path, self.catalog.labels)
+        expressiveness, analyzability = self.catalog.score(*hierarchy.weightVector(self.catalog.labels))
+        expressiveness = expressiveness[self.positions]
+        analyzability = analyzability[self.positions]
+        total = expressiveness + analyzability
+        order = np.argsort(-total, kind='stable')
+        # Tied models share the best of their ranks, as in the exported results (cf. export.py).
+        ranks = rankDescending(total[:, np.newaxis])[:, 0]
+        files = []
+        for f in self.formats:
+            file = os.path.join(output, name + '.' + f)
+            if f in PLOT_FORMATS:
+                self.points.setData(expressiveness, analyzability)
+                self.graph.getPlotItem().setTitle(name, color='k')
+                self.application.processEvents()
+                self.exporters[f](self.graph.getPlotItem()).export(file)
+            else:
+                rows = [(int(ranks[j]), self.catalog.names[self.positions[j]], formatValue(expressiveness[j]), formatValue(analyzability[j])) for j in order.tolist()]
+                with open(file, 'w', newline='') as out:
+                    if f == 'csv':
+                        self.writeCSV(out, rows)
+                    else:
+                        self.writeHTML(out, name, rows)
+            files.append(file)
+        return files
+
+    def writeCSV(self, f, rows):
+        """!
+        @brief Write a ranked table in CSV format.
+        @param f The file to write.
+        @param rows The rows of the table (rank, model, expressiveness, analyzability).
+        """
+        writer = csv.writer(f)
+        writer.writerow(['Rank', 'Model', 'Expressiveness', 'Analyzability'])
+        writer.writerows(rows)
+
+    def writeHTML(self, f, title, rows):
+        """!
+        @brief Write a ranked table in HTML format.
+        @param f The file to write.
+        @param title The title of the table.
+        @param rows The rows of the table (rank, model, expressiveness, analyzability).
+        """
+        f.write('<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8"><title>' + html.escape(title) + '</title></head>\n<body>\n')
+        f.write('<h1>' + html.escape(title) + '</h1>\n<table>\n<tr><th>Rank</th><th>Model</th><th>Expressiveness</th><th>Analyzability</th></tr>\n')
+        for row in rows:
+            f.write('<tr>' + ''.join('<td>' + html.escape(str(v)) + '</td>' for v in row) + '</tr>\n')
+        f.write('</table>\n</body>\n</html>\n')
+
+
+def initWorker(catalog, filters, formats):
+    """!
+    @brief Initialize a worker process with its renderer.
+    @param catalog The compiled catalog.
+    @param filters The filters selecting the models.
+    @param formats The formats to export.
+    """
+    worker['renderer'] = ReportRenderer(catalog, filters, formats)
+
+
+def renderInWorker(path, output, name):
+    """!
+    @brief Render a hierarchy in a worker process.
+    @param path The path of the hierarchy file.
+    @param output The directory of the exported files.
+    @param name The name of the exported files.
+    @return The paths of the exported files.
+    """
+    return worker['renderer'].render(path, output, name)
+
+
+def outputNames(paths):
+    """!
+    @brief Get the names of the exported files of several hierarchies, the base name of their file without extension. Hierarchy files with the same base name get a numbered suffix, so that their exported files do not overwrite each other.
+    @param paths The paths of the hierarchy files.
+    @return The names, in the order of the paths.
+    """
+    bases = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    names = []
+    used = set(bases)
+    for i, base in enumerate(bases):
+        name = base
+        if base in bases[:i]:
+            suffix = 2
+            while base + '-' + str(suffix) in used:
+                suffix += 1
+            name = base + '-' + str(suffix)
+            used.add(name)
+        names.append(name)
+    return names
+
+
+def renderReports(catalog, paths, output, formats, filters=None, workers=1):
+    """!
+    @brief Render the graph and the table of several hierarchies.
+    @param catalog The compiled catalog.
+    @param paths The paths of the hierarchy files.
+    @param output The directory of the exported files.
+    @param formats The formats to export.
+    @param filters The filters selecting the models, all models by default.
+    @param workers The number of worker processes, 1 to render in the current process.
+    @return An iterator over the paths of the exported files of each hierarchy.
+    """
+    os.makedirs(output, exist_ok=True)
+    filters = filters or {}
+    names = outputNames(paths)
+    if workers <= 1:
+        renderer = ReportRenderer(catalog, filters, formats)
+        for path, name in zip(paths, names):
+            yield renderer.render(path, output, name)
+        return
+    # Worker processes are spawned rather than forked, forked processes must not use Qt.
+    with multiprocessing.get_context('spawn').Pool(workers, initWorker, (catalog, filters, formats)) as pool:
+        yield from pool.starmap(renderInWorker, [(path, output, name) for path, name in zip(paths, names)])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Render the graph and the ranked table of the dataflow models for several hierarchies')
+    parser.add_argument('hierarchies', type=str, nargs='+', help='Hierarchy files')
+    parser.add_argument('-o', '--output', type=str, default='report', help='Directory of the exported files')
+    parser.add_argument('--formats', type=str, nargs='+', default=['png', 'csv'], choices=PLOT_FORMATS + TABLE_FORMATS, help='Formats to export')
+    parser.add_argument('--filters', type=str, default=None, help='JSON file with the filters selecting the models (cf. source/service.py), all models by default')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of worker processes')
+    parser.add_argument('--classification', type=str, nargs='+', default=['resources/classification.json'], help='Classification files (JSON or JSON Lines)')
+    parser.add_argument('--features', type=str, default='resources/features.json', help='Features file')
+    parser.add_argument('--analyzability', type=str, default='resources/analyzability.json', help='Static analyses file')
+    args = parser.parse_args()
+    with open(args.features) as f:
+        features = json.load(f)
+    with open(args.analyzability) as f:
+        analyzability = json.load(f)
+    filters = None
+    if args.filters:
+        with open(args.filters) as f:
+            filters = json.load(f)
+    catalog, _ = loadCatalog(args.classification, features, analyzability)
+    for files in renderReports(catalog, args.hierarchies, args.output, args.formats, filters, min(args.workers, len(args.hierarchies))):
+        print(' '.join(files))
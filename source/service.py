@@ -0,0 +1,298 @@
+"""!
+@file service.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the local HTTP service scoring the dataflow models for other tools, without the GUI.
+
+The service keeps the compiled catalog in memory and gathers the requests received at the same time in a single batched product. It listens on a TCP port or on a Unix socket:
+```bash
+python3 source/service.py --port 8080
+python3 source/service.py --unix /tmp/dfmoccs.sock resources/classification.json in-house-variants.jsonl
+```
+Endpoints:
+- `POST /score` with a JSON body `{"hierarchy": <hierarchy>, "filters": <filters>, "models": [keys]}` where all fields are optional (the default hierarchy is `resources/hierarchy-example.json`). `<hierarchy>` has the structure of a hierarchy file. `<filters>` is `{"features": [abbreviations], "all_features": Boolean, "analyzability": [abbreviations], "all_analyzability": Boolean, "turing_complete": [true, false, null]}`, with the semantics of the filter box of the GUI. The response is `{"models": [{"key", "name", "expressiveness", "analyzability"}]}`.
+- `GET /metrics` returns the number of requests and batches, the mean batch size, the latency percentiles and the throughput.
+- `GET /health` returns `{"status": "ok"}`.
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from collections import deque
+
+import numpy as np
+
+from catalog import CompiledCatalog
+from hierarchy import Hierarchy
+from ingestion import loadCatalog
+
+## Time waited for other requests before scoring a batch, in seconds.
+BATCH_WINDOW = 0.002
+## Maximum number of requests scored in a single batch.
+MAX_BATCH_SIZE = 256
+## Number of latencies kept to compute the percentiles.
+LATENCY_HISTORY = 10000
+## Reason phrases of the HTTP status codes used by the service.
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+class ServiceError(Exception):
+    """!
+    @brief This exception is raised when a request cannot be served.
+    """
+
+    def __init__(self, status, message):
+        """!
+        @brief Create a service error.
+        @param status The HTTP status code.
+        @param message The error message.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class ScoringService:
+    """!
+    @brief This class implements the scoring service.
+    """
+
+    def __init__(self, catalog, hierarchy, batch_window=BATCH_WINDOW, max_batch_size=MAX_BATCH_SIZE):
+        """!
+        @brief Create the scoring service.
+        @param catalog The compiled catalog.
+        @param hierarchy The hierarchy used by the requests which do not give one.
+        @param batch_window The time waited for other requests before scoring a batch, in seconds.
+        @param max_batch_size The maximum number of requests scored in a single batch.
+        """
+        self.catalog = catalog
+        self.hierarchy = hierarchy
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.queue = None
+        self.batcher = None
+        self.server = None
+        self.connections = set()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.latencies = deque(maxlen=LATENCY_HISTORY)
+        self.start_time = time.perf_counter()
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """!
+        @brief Start listening on a TCP port or on a Unix socket.
+        @param host The host of the TCP server.
+        @param port The TCP port, 0 to choose a free port.
+        @param path The path of the Unix socket, None to listen on a TCP port.
+        @return The asyncio server, e.g. `server.sockets[0].getsockname()` gives the chosen port.
+        """
+        self.queue = asyncio.Queue()
+        self.batcher = asyncio.ensure_future(self.batchRequests())
+        if path is None:
+            self.server = await asyncio.start_server(self.handleConnection, host, port)
+        else:
+            self.server = await asyncio.start_unix_server(self.handleConnection, path)
+        return self.server
+
+    async def stop(self):
+        """!
+        @brief Stop the service.
+        """
+        self.server.close()
+        for connection in self.connections:
+            connection.cancel()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        await self.server.wait_closed()
+        self.batcher.cancel()
+
+    async def handleConnection(self, reader, writer):
+        """!
+        @brief Serve the HTTP/1.1 requests of a connection until the client closes it.
+        @param reader The stream reader of the connection.
+        @param writer The stream writer of the connection.
+        """
+        connection = asyncio.current_task()
+        self.connections.add(connection)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                start = time.perf_counter()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = headers.get('content-length', '0')
+                if not length.isdecimal():
+                    # The end of the body is unknown, so the connection is closed after the response.
+                    await self.respond(writer, 400, {'error': 'Invalid Content-Length: ' + length}, start)
+                    break
+                body = await reader.readexactly(int(length))
+                try:
+                    method, target, _ = request_line.decode('latin-1').split(' ', 2)
+                    status, response = 200, await self.route(method, target, body)
+                except ServiceError as e:
+                    status, response = e.status, {'error': str(e)}
+                except (ValueError, TypeError) as e:
+                    status, response = 400, {'error': str(e)}
+                await self.respond(writer, status, response, start)
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.connections.discard(connection)
+            writer.close()
+
+    async def respond(self, writer, status, response, start):
+        """!
+        @brief Send the response to a request and record its latency.
+        @param writer The stream writer of the connection.
+        @param status The HTTP status code.
+        @param response The JSON response.
+        @param start The time the request was received, given by time.perf_counter().
+        """
+        self.requests += 1
+        if status != 200:
+            self.errors += 1
+        payload = json.dumps(response).encode()
+        writer.write(('HTTP/1.1 ' + str(status) + ' ' + REASONS[status] + '\r\nContent-Type: application/json\r\nContent-Length: ' + str(len(payload)) + '\r\n\r\n').encode() + payload)
+        await writer.drain()
+        self.latencies.append(time.perf_counter() - start)
+
+    async def route(self, method, target, body):
+        """!
+        @brief Serve a request.
+        @param method The HTTP method.
+        @param target The path of the request.
+        @param body The body of the request.
+        @return The JSON response.
+        @throw ServiceError If the request cannot be served.
+        """
+        path = target.split('?', 1)[0]
+        if path == '/score':
+            if method != 'POST':
+                raise ServiceError(405, 'Use POST to score models.')
+            return await self.score(json.loads(body or b'{}'))
+        if path == '/metrics':
+            return self.metrics()
+        if path == '/health':
+            return {'status': 'ok'}
+        raise ServiceError(404, 'Unknown path: ' + path)
+
+    async def score(self, request):
+        """!
+        @brief Score the models of a request, together with the other pending requests.
+        @param request The JSON body of the request.
+        @return The JSON response.
+        @throw ValueError If the request is not valid.
+        """
+        if not isinstance(request, dict):
+            raise ValueError('The request must be a JSON object.')
+        hierarchy = Hierarchy.fromJSON(request['hierarchy'], self.catalog.labels) if 'hierarchy' in request else self.hierarchy
+        mask = self.catalog.filterMaskFromJSON(request.get('filters', {}))
+        if 'models' in request:
+            unknown = [m for m in request['models'] if m not in self.catalog.index]
+            if unknown:
+                raise ValueError('Unknown models: ' + ', '.join(map(str, unknown)))
+            selected = self.catalog.indicesOf(request['models'])
+            positions = selected[mask[selected]]
+        else:
+            positions = np.flatnonzero(mask)
+        weights, offset = hierarchy.weightVector(self.catalog.labels)
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((weights, offset, future))
+        expressiveness, analyzability = await future
+        return {'models': [
+            {'key': self.catalog.keys[p], 'name': self.catalog.names[p], 'expressiveness': e, 'analyzability': a}
+            for p, e, a in zip(positions.tolist(), expressiveness[positions].tolist(), analyzability[positions].tolist())
+        ]}
+
+    async def batchRequests(self):
+        """!
+        @brief Gather the pending requests and score them in a single batched product.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            weights = np.stack([w for w, _, _ in batch], axis=1)
+            offsets = np.array([o for _, o, _ in batch], dtype=np.float64)
+            try:
+                expressiveness, analyzability = await loop.run_in_executor(None, self.catalog.score, weights, offsets)
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.batched_requests += len(batch)
+            for i, (_, _, future) in enumerate(batch):
+                if not future.cancelled():
+                    future.set_result((expressiveness[:, i], analyzability[:, i]))
+
+    def metrics(self):
+        """!
+        @brief Get the latency and throughput metrics of the service.
+        @return The JSON metrics.
+        """
+        latencies = np.array(self.latencies) * 1000
+        uptime = time.perf_counter() - self.start_time
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'batches': self.batches,
+            'mean_batch_size': self.batched_requests / self.batches if self.batches else 0,
+            'latency_ms': {q: float(np.percentile(latencies, int(q[1:]))) if len(latencies) else 0 for q in ('p50', 'p95', 'p99')},
+            'throughput_per_s': self.requests / uptime if uptime > 0 else 0,
+            'uptime_s': uptime,
+            'models': len(self.catalog)
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Local service scoring the dataflow models')
+    parser.add_argument('sources', type=str, nargs='*', default=['resources/classification.json'], help='Classification files (JSON or JSON Lines), or a compiled catalog (.npz)')
+    parser.add_argument('--features', type=str, default='resources/features.json', help='Features file')
+    parser.add_argument('--analyzability', type=str, default='resources/analyzability.json', help='Static analyses file')
+    parser.add_argument('--hierarchy', type=str, default='resources/hierarchy-example.json', help='Hierarchy used by the requests which do not give one')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Host of the TCP server')
+    parser.add_argument('--port', type=int, default=8080, help='Port of the TCP server')
+    parser.add_argument('--unix', type=str, default=None, help='Listen on this Unix socket instead of a TCP port')
+    args = parser.parse_args()
+    if len(args.sources) == 1 and args.sources[0].endswith('.npz'):
+        catalog = CompiledCatalog.load(args.sources[0])
+    else:
+        with open(args.features) as f:
+            features = json.load(f)
+        with open(args.analyzability) as f:
+            analyzability = json.load(f)
+        catalog, issues = loadCatalog(args.sources, features, analyzability)
+        for issue in issues:
+            print(issue, file=sys.stderr)
+    service = ScoringService(catalog, Hierarchy.load(args.hierarchy, catalog.labels))
+
+    async def main():
+        server = await service.start(args.host, args.port, args.unix)
+        print("Listening on " + (args.unix or args.host + ':' + str(server.sockets[0].getsockname()[1])), file=sys.stderr)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,72 @@
+"""!
+@file session.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the session files of the GUI, which store the state of the view and the scores displayed in it.
+
+A session file is a numpy archive with the state of the view (filters, hierarchy and selected model) as a JSON string, and the expressiveness and analyzability scores of all the models of the catalog tagged with the fingerprint of the catalog (cf. CompiledCatalog.fingerprint()). The scores are reused when the session is opened with the same catalog.
+"""
+
+import json
+
+import numpy as np
+
+## Version of the session files.
+SESSION_VERSION = 1
+
+
+class Session:
+    """!
+    @brief This class describes a session of the GUI.
+    """
+
+    def __init__(self, filters, hierarchy, selected_model=None, catalog_hash=None, expressiveness=None, analyzability=None):
+        """!
+        @brief Create a session.
+        @param filters The state of the filters: the labels of the checked features and static analyses, the All/Any radio buttons and the Turing classes checkboxes.
+        @param hierarchy The hierarchy, with the structure of a hierarchy file.
+        @param selected_model The key of the model selected in the table, None if no model is selected.
+        @param catalog_hash The fingerprint of the catalog the scores were computed with, None if the scores are not stored.
+        @param expressiveness The expressiveness scores of all the models of the catalog.
+        @param analyzability The analyzability scores of all the models of the catalog.
+        """
+        self.filters = filters
+        self.hierarchy = hierarchy
+        self.selected_model = selected_model
+        self.catalog_hash = catalog_hash
+        self.expressiveness = expressiveness
+        self.analyzability = analyzability
+
+    def save(self, path):
+        """!
+        @brief Save the session.
+        @param path The path of the session file.
+        """
+        state = {'version': SESSION_VERSION, 'filters': self.filters, 'hierarchy': self.hierarchy, 'selected_model': self.selected_model, 'catalog_hash': self.catalog_hash}
+        arrays = {}
+        if self.catalog_hash is not None:
+            arrays = {'expressiveness': self.expressiveness, 'analyzability': self.analyzability}
+        # Writing to a file object keeps the path unchanged, np.savez_compressed() would add the .npz extension.
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, session=np.array(json.dumps(state)), **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """!
+        @brief Load a session saved by save().
+        @param path The path of the session file.
+        @return The session.
+        @throw ValueError If the file is not a valid session file.
+        """
+        try:
+            with np.load(path) as archive:
+                state = json.loads(str(archive['session']))
+                scores = (archive['expressiveness'], archive['analyzability']) if 'expressiveness' in archive else (None, None)
+        except (KeyError, OSError, EOFError) as e:
+            raise ValueError('Not a session file: ' + str(e))
+        if not isinstance(state, dict) or state.get('version') != SESSION_VERSION:
+            raise ValueError('Unsupported session file version.')
+        if not isinstance(state.get('filters'), dict) or not isinstance(state.get('hierarchy'), dict):
+            raise ValueError('A session must have filters and a hierarchy.')
+        return cls(state['filters'], state['hierarchy'], state.get('selected_model'), state.get('catalog_hash') if scores[0] is not None else None, *scores)
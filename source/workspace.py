@@ -0,0 +1,42 @@
+"""!
+@file workspace.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the data shared by the linked views of the GUI.
+"""
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class Workspace(QObject):
+    """!
+    @brief This class holds the data shared by the linked views of the GUI: the features, the static analyses, the classification, the compiled catalog (with its index and its score cache) and the selected model.
+
+    Each view has its own hierarchy, filters and history. Opening a view only creates its widgets, the catalog is neither copied nor compiled again, and the scores of a hierarchy already displayed by another view are taken from the shared cache.
+    """
+
+    ## Signal emitted with the key of the selected model (None when no model is selected).
+    selectionChanged = pyqtSignal(object)
+    ## Signal emitted after the catalog changed, with the changed models (key to description, or to None for a removed model), or None after the features and static analyses changed.
+    catalogChanged = pyqtSignal(object)
+
+    def __init__(self):
+        """!
+        @brief Create an empty workspace.
+        """
+        super().__init__()
+        self.features = {}
+        self.analyzability = {}
+        self.dataflow_models = {}
+        self.catalog = None
+        self.selected_model = None
+        self.views = []
+
+    def select(self, model):
+        """!
+        @brief Select a model in all the views.
+        @param model The key of the model, None to clear the selection.
+        """
+        self.selected_model = model
+        self.selectionChanged.emit(model)
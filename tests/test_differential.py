@@ -0,0 +1,59 @@
+"""!
+@file test_differential.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the tests checking the scoring and filtering engines against the per-model reference implementation of the GUI, with the differential test harness.
+
+Usage:
+```bash
+python3 -m pytest tests
+```
+"""
+
+import os
+import sys
+import random
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'source'))
+
+from differential import ReferenceEngine, catalogEngine, initialCase, randomCase, runHarness, shrinkCandidates
+
+## Number of random cases checked for each engine.
+CASES = 300
+## Seed of the random generator, fixed so that a failure is reproducible with `python3 source/differential.py --seed`.
+SEED = 0
+
+
+@pytest.fixture(scope='module')
+def reference():
+    """!
+    @brief Create the reference engine, from the directory containing `resources`.
+    @return The reference engine.
+    """
+    directory = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        yield ReferenceEngine()
+    finally:
+        os.chdir(directory)
+
+
+@pytest.mark.parametrize('name', ['catalog', 'gui'])
+def test_engine_matches_reference(reference, name):
+    engine = catalogEngine if name == 'catalog' else reference.gui
+    failure = runHarness(engine, reference, CASES, SEED)
+    assert failure is None, failure[1]
+
+
+def test_simplifications_shrink_case(reference):
+    # Each simplification, including resetting a coefficient or an update policy to its default, must be accepted by shrink().
+    rng = random.Random(SEED)
+    initial = initialCase(reference.window)
+    for case in [initial] + [randomCase(rng, reference.feature_labels, reference.analyzability_labels, initial) for _ in range(CASES)]:
+        assert all(candidate.size() < case.size() for candidate in shrinkCandidates(case))
@@ -0,0 +1,170 @@
+"""!
+@file test_service.py
+@author guillaume.roumage.research@proton.me
+@date 19/10/2026
+
+@brief This file contains the tests of the local scoring service, run against a client on the loopback interface.
+
+Usage:
+```bash
+python3 -m pytest tests
+```
+"""
+
+import os
+import sys
+import json
+import asyncio
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'source'))
+
+import catalog as catalog_module
+from catalog import CompiledCatalog
+from hierarchy import Hierarchy
+from service import ScoringService
+
+## Number of concurrent requests sent to check the batching.
+CONCURRENT_REQUESTS = 32
+
+
+def loadCatalog():
+    """!
+    @brief Compile the classification of the repository.
+    @return The compiled catalog and the example hierarchy.
+    """
+    with open(os.path.join(ROOT, 'resources', 'features.json')) as f:
+        features = json.load(f)
+    with open(os.path.join(ROOT, 'resources', 'analyzability.json')) as f:
+        analyzability = json.load(f)
+    with open(os.path.join(ROOT, 'resources', 'classification.json')) as f:
+        dataflow_models = json.load(f)
+    catalog = CompiledCatalog(features, analyzability, dataflow_models)
+    return catalog, Hierarchy.load(os.path.join(ROOT, 'resources', 'hierarchy-example.json'), catalog.labels)
+
+
+async def send(port, request):
+    """!
+    @brief Send a raw HTTP request on a new connection and read the response until the service closes the connection.
+    @param port The port of the service.
+    @param request The raw request.
+    @return The status code and the JSON response.
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(request)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split(b' ')[1]), json.loads(body)
+
+
+async def call(port, method, path, body=None):
+    """!
+    @brief Send a request to the service.
+    @param port The port of the service.
+    @param method The HTTP method.
+    @param path The path of the request.
+    @param body The JSON body of the request, None for no body.
+    @return The status code and the JSON response.
+    """
+    payload = json.dumps(body).encode() if body is not None else b''
+    return await send(port, (method + ' ' + path + ' HTTP/1.1\r\nContent-Length: ' + str(len(payload)) + '\r\nConnection: close\r\n\r\n').encode() + payload)
+
+
+def serve(test, **options):
+    """!
+    @brief Run a test against a service listening on a free port.
+    @param test The coroutine function of the test, called with the service, its port, the catalog and the default hierarchy.
+    @param options The options of the service.
+    """
+    catalog, hierarchy = loadCatalog()
+
+    async def main():
+        service = ScoringService(catalog, hierarchy, **options)
+        server = await service.start(port=0)
+        try:
+            await test(service, server.sockets[0].getsockname()[1], catalog, hierarchy)
+        finally:
+            await service.stop()
+
+    asyncio.run(main())
+
+
+def test_concurrent_requests_are_batched():
+    async def test(service, port, catalog, hierarchy):
+        responses = await asyncio.gather(*[call(port, 'POST', '/score', {'hierarchy': {'weights': {'Delay': i}}}) for i in range(CONCURRENT_REQUESTS)])
+        assert all(status == 200 for status, _ in responses)
+        status, metrics = await call(port, 'GET', '/metrics')
+        assert status == 200
+        assert metrics['requests'] == CONCURRENT_REQUESTS
+        assert metrics['batches'] < CONCURRENT_REQUESTS
+        assert metrics['mean_batch_size'] > 1
+        assert metrics['mean_batch_size'] * metrics['batches'] == CONCURRENT_REQUESTS
+
+    # A long batch window gathers all the concurrent requests even on a slow machine.
+    serve(test, batch_window=0.1)
+
+
+def test_scores_match_catalog():
+    async def test(service, port, catalog, hierarchy):
+        weighted = {'weights': {'Delay': 3, 'Parameters': -1}}
+        (status, default), (weighted_status, response) = await asyncio.gather(call(port, 'POST', '/score', {}), call(port, 'POST', '/score', {'hierarchy': weighted}))
+        assert status == weighted_status == 200
+        for body, scored in ((default, hierarchy), (response, Hierarchy.fromJSON(weighted, catalog.labels))):
+            expressiveness, analyzability = catalog.score(*scored.weightVector(catalog.labels))
+            assert [m['key'] for m in body['models']] == catalog.keys
+            assert np.allclose([m['expressiveness'] for m in body['models']], expressiveness)
+            assert np.allclose([m['analyzability'] for m in body['models']], analyzability)
+
+    serve(test)
+
+
+def test_selected_and_filtered_models():
+    async def test(service, port, catalog, hierarchy):
+        models = catalog.keys[:5]
+        status, response = await call(port, 'POST', '/score', {'models': models, 'filters': {'turing_complete': [True]}})
+        assert status == 200
+        mask = catalog.filterMaskFromJSON({'turing_complete': [True]})
+        assert [m['key'] for m in response['models']] == [m for m in models if mask[catalog.index[m]]]
+
+    serve(test)
+
+
+def test_errors():
+    async def test(service, port, catalog, hierarchy):
+        assert (await call(port, 'POST', '/score', {'models': ['unknown model']}))[0] == 400
+        assert (await send(port, b'POST /score HTTP/1.1\r\nContent-Length: 5\r\nConnection: close\r\n\r\n{"a":'))[0] == 400
+        assert (await call(port, 'POST', '/score', ['not', 'an', 'object']))[0] == 400
+        assert (await call(port, 'GET', '/unknown'))[0] == 404
+        assert (await call(port, 'GET', '/score'))[0] == 405
+        status, metrics = await call(port, 'GET', '/metrics')
+        assert status == 200 and metrics['errors'] == 5
+
+    serve(test)
+
+
+def test_invalid_content_length():
+    async def test(service, port, catalog, hierarchy):
+        status, response = await send(port, b'POST /score HTTP/1.1\r\nContent-Length: twelve\r\n\r\n{}')
+        assert status == 400
+        assert 'Content-Length' in response['error']
+        assert (await call(port, 'GET', '/health')) == (200, {'status': 'ok'})
+
+    serve(test)
+
+
+def test_batches_scored_in_chunks(monkeypatch):
+    async def test(service, port, catalog, hierarchy):
+        responses = await asyncio.gather(*[call(port, 'POST', '/score', {'hierarchy': {'weights': {'Delay': i}}}) for i in range(CONCURRENT_REQUESTS)])
+        for i, (status, response) in enumerate(responses):
+            expressiveness, analyzability = catalog.score(*Hierarchy.fromJSON({'weights': {'Delay': i}}, catalog.labels).weightVector(catalog.labels))
+            assert status == 200
+            assert np.allclose([m['expressiveness'] for m in response['models']], expressiveness)
+            assert np.allclose([m['analyzability'] for m in response['models']], analyzability)
+
+    # A tiny product size splits each batch into many chunks of rows.
+    monkeypatch.setattr(catalog_module, 'PRODUCT_SIZE', 256)
+    serve(test, batch_window=0.1)